@@ -1,7 +1,8 @@
 from __future__ import absolute_import
 
 from contextlib import contextmanager
-import copy
+import json
+import threading
 
 import dbt.compat
 import dbt.deprecations
@@ -12,18 +13,22 @@ import dbt.clients.gcloud
 import dbt.clients.agate_helper
 
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.adapters.bigquery.poller import JobPoller
 from dbt.adapters.bigquery.relation import BigQueryRelation
 from dbt.contracts.connection import Connection
 from dbt.logger import GLOBAL_LOGGER as logger
 
 import google.auth
+import google.auth.transport.requests
 import google.api_core
 import google.oauth2
 import google.cloud.exceptions
 import google.cloud.bigquery
 
-import time
 import agate
+import requests.adapters
+
+from multiprocessing.dummy import Pool as ThreadPool
 
 
 class BigQueryAdapter(PostgresAdapter):
@@ -42,6 +47,7 @@ class BigQueryAdapter(PostgresAdapter):
         "load_dataframe",
         "get_missing_columns",
         "cache_new_relation",
+        "clear_cached_columns",
 
         "create_schema",
         "alter_table_add_columns",
@@ -52,6 +58,7 @@ class BigQueryAdapter(PostgresAdapter):
         "rename_relation",
 
         "get_columns_in_table",
+        "get_columns_in_relations",
 
         # formerly profile functions
         "add_query",
@@ -68,9 +75,23 @@ class BigQueryAdapter(PostgresAdapter):
     }
 
     QUERY_TIMEOUT = 300
+    # the number of tables fetched at once while building the catalog
+    CATALOG_THREADS = 16
+    # the number of HTTP connections each shared client keeps open, enough
+    # for every thread plus the catalog workers
+    HTTP_POOL_SIZE = 32
+
+    # clients are thread-safe, so every connection with the same credentials
+    # shares one client and its HTTP connection pool
+    _clients = {}
+    _clients_lock = threading.Lock()
     Relation = BigQueryRelation
     Column = dbt.schema.BigQueryColumn
 
+    def __init__(self, config):
+        super(BigQueryAdapter, self).__init__(config)
+        self.job_poller = JobPoller()
+
     @classmethod
     def handle_error(cls, error, message, sql):
         logger.debug(message.format(sql=sql))
@@ -143,7 +164,32 @@ class BigQueryAdapter(PostgresAdapter):
         project_name = profile_credentials.project
         creds = cls.get_bigquery_credentials(profile_credentials)
 
-        return google.cloud.bigquery.Client(project_name, creds)
+        session = google.auth.transport.requests.AuthorizedSession(creds)
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=cls.HTTP_POOL_SIZE,
+            pool_maxsize=cls.HTTP_POOL_SIZE)
+        session.mount('https://', http_adapter)
+
+        return google.cloud.bigquery.Client(project_name, creds,
+                                            _http=session)
+
+    @classmethod
+    def get_shared_client(cls, profile_credentials):
+        """Return the client for the given credentials, creating it the
+        first time they are used in this process.
+        """
+        key = json.dumps(profile_credentials.serialize(), sort_keys=True)
+
+        with cls._clients_lock:
+            if key not in cls._clients:
+                cls._clients[key] = cls.get_bigquery_client(
+                    profile_credentials)
+            return cls._clients[key]
+
+    @classmethod
+    def clear_shared_clients(cls):
+        with cls._clients_lock:
+            cls._clients.clear()
 
     @classmethod
     def open_connection(cls, connection):
@@ -152,13 +198,13 @@ class BigQueryAdapter(PostgresAdapter):
             return connection
 
         try:
-            handle = cls.get_bigquery_client(connection.credentials)
+            handle = cls.get_shared_client(connection.credentials)
 
         except google.auth.exceptions.DefaultCredentialsError as e:
             logger.info("Please log into GCP to continue")
             dbt.clients.gcloud.setup_default_credentials()
 
-            handle = cls.get_bigquery_client(connection.credentials)
+            handle = cls.get_shared_client(connection.credentials)
 
         except Exception as e:
             raise
@@ -180,6 +226,12 @@ class BigQueryAdapter(PostgresAdapter):
 
         return connection
 
+    @classmethod
+    def ping_connection(cls, connection):
+        # BigQuery clients talk to a stateless HTTP API, so there is no session
+        # that could have gone away.
+        pass
+
     def _link_cached_relations(self, manifest, schemas):
         pass
 
@@ -208,6 +260,10 @@ class BigQueryAdapter(PostgresAdapter):
         except google.api_core.exceptions.NotFound as e:
             return []
 
+    def _list_relations_in_schemas(self, schemas, model_name=None):
+        # datasets can't be listed with a single query
+        return self._list_relations_in_parallel(schemas, model_name)
+
     def get_relation(self, schema, identifier, model_name=None):
         if self._schema_is_cached(schema, model_name):
             # if it's in the cache, use the parent's model of going through
@@ -224,6 +280,7 @@ class BigQueryAdapter(PostgresAdapter):
     def drop_relation(self, relation, model_name=None):
         if self._schema_is_cached(relation.schema, model_name):
             self.cache.drop(relation)
+        self.column_cache.invalidate(relation.schema, relation.identifier)
 
         conn = self.get_connection(model_name)
         client = conn.handle
@@ -253,6 +310,7 @@ class BigQueryAdapter(PostgresAdapter):
         conn = self.get_connection(model_name)
         client = conn.handle
 
+        self.column_cache.invalidate(dataset.dataset_id, model_alias)
         view_ref = dataset.table(model_alias)
         view = google.cloud.bigquery.Table(view_ref)
         view.view_query = model_sql
@@ -265,16 +323,8 @@ class BigQueryAdapter(PostgresAdapter):
 
         return "CREATE VIEW"
 
-    @classmethod
-    def poll_until_job_completes(cls, job, timeout):
-        retry_count = timeout
-
-        while retry_count > 0 and job.state != 'DONE':
-            retry_count -= 1
-            time.sleep(1)
-            job.reload()
-
-        if job.state != 'DONE':
+    def poll_until_job_completes(self, job, timeout, client):
+        if not self.job_poller.wait(job, client, timeout):
             raise dbt.exceptions.RuntimeException("BigQuery Timeout Exceeded")
 
         elif job.error_result:
@@ -285,6 +335,7 @@ class BigQueryAdapter(PostgresAdapter):
         conn = self.get_connection(model_name)
         client = conn.handle
 
+        self.column_cache.invalidate(dataset_name, identifier)
         dataset = self.get_dataset(dataset_name, identifier)
         table_ref = dataset.table(identifier)
         table = google.cloud.bigquery.Table(table_ref)
@@ -305,6 +356,7 @@ class BigQueryAdapter(PostgresAdapter):
         else:
             table_name = "{}${}".format(model_alias, decorator)
 
+        self.column_cache.invalidate(dataset.dataset_id, model_alias)
         table_ref = dataset.table(table_name)
         job_config = google.cloud.bigquery.QueryJobConfig()
         job_config.destination = table_ref
@@ -316,7 +368,8 @@ class BigQueryAdapter(PostgresAdapter):
         # this waits for the job to complete
         with self.exception_handler(model_sql, model_alias,
                                     model_name):
-            query_job.result(timeout=self.get_timeout(conn))
+            self.poll_until_job_completes(query_job, self.get_timeout(conn),
+                                          client)
 
         return "CREATE TABLE"
 
@@ -360,6 +413,7 @@ class BigQueryAdapter(PostgresAdapter):
 
         # this blocks until the query has completed
         with self.exception_handler(sql, model_name):
+            self.poll_until_job_completes(query_job, None, client)
             iterator = query_job.result()
 
         return query_job, iterator
@@ -384,6 +438,7 @@ class BigQueryAdapter(PostgresAdapter):
 
         logger.debug('Adding columns ({}) to table {}".'.format(
                      columns, relation))
+        self.column_cache.invalidate(relation.schema, relation.identifier)
 
         conn = self.get_connection(model_name)
         client = conn.handle
@@ -473,8 +528,8 @@ class BigQueryAdapter(PostgresAdapter):
             all_datasets = client.list_datasets(include_all=True)
             return [ds.dataset_id for ds in all_datasets]
 
-    def get_columns_in_table(self, schema_name, table_name,
-                             database=None, model_name=None):
+    def _get_columns_in_table(self, schema_name, table_name,
+                              database=None, model_name=None):
 
         # BigQuery does not have databases -- the database parameter is here
         # for consistency with the base implementation
@@ -492,6 +547,26 @@ class BigQueryAdapter(PostgresAdapter):
             logger.debug("get_columns_in_table error: {}".format(e))
             return []
 
+    def _get_columns_in_tables(self, schema_name, table_names,
+                               model_name=None):
+        # datasets have no information_schema to query, so fetch the tables
+        # in parallel instead. Open the connection up front so that every
+        # thread shares its client.
+        self.get_connection(model_name)
+
+        def get_columns(table_name):
+            return table_name, self._get_columns_in_table(
+                schema_name, table_name, model_name=model_name)
+
+        pool = ThreadPool(min(len(table_names), self.config.threads))
+        try:
+            results = pool.map(get_columns, table_names)
+        finally:
+            pool.close()
+            pool.join()
+
+        return {name: columns for name, columns in results if columns}
+
     def get_dbt_columns_from_bq_table(self, table):
         "Translates BQ SchemaField dicts into dbt BigQueryColumn objects"
 
@@ -604,6 +679,7 @@ class BigQueryAdapter(PostgresAdapter):
     def load_dataframe(self, schema, table_name, agate_table,
                        column_override, model_name=None):
         bq_schema = self._agate_to_schema(agate_table, column_override)
+        self.column_cache.invalidate(schema, table_name)
         dataset = self.get_dataset(schema, None)
         table = dataset.table(table_name)
         conn = self.get_connection(None)
@@ -618,7 +694,7 @@ class BigQueryAdapter(PostgresAdapter):
                                               job_config=load_config)
 
         with self.exception_handler("LOAD TABLE"):
-            self.poll_until_job_completes(job, self.get_timeout(conn))
+            self.poll_until_job_completes(job, self.get_timeout(conn), client)
 
     def expand_target_column_types(self, temp_table,
                                    to_schema, to_table, model_name=None):
@@ -713,35 +789,48 @@ class BigQueryAdapter(PostgresAdapter):
         all_names = column_names + self._get_stats_column_names()
         columns = []
 
+        relations = []
         for schema_name in schemas:
-            relations = self.list_relations(schema_name)
-            for relation in relations:
-
-                # This relation contains a subset of the info we care about.
-                # Fetch the full table object here
-                dataset_ref = client.dataset(relation.schema)
-                table_ref = dataset_ref.table(relation.identifier)
-                table = client.get_table(table_ref)
-
-                flattened = self._flat_columns_in_table(table)
-                relation_stats = dict(self._get_stats_columns(table,
-                                                              relation.type))
-
-                for index, column in enumerate(flattened, start=1):
-                    column_data = (
-                        relation.schema,
-                        relation.name,
-                        relation.type,
-                        None,
-                        None,
-                        column.name,
-                        index,
-                        column.data_type,
-                        None,
-                    )
-                    column_dict = dict(zip(column_names, column_data))
-                    column_dict.update(copy.deepcopy(relation_stats))
-
-                    columns.append(column_dict)
+            relations.extend(self.list_relations(schema_name))
+
+        def get_table(relation):
+            # This relation contains a subset of the info we care about.
+            # Fetch the full table object here
+            dataset_ref = client.dataset(relation.schema)
+            table_ref = dataset_ref.table(relation.identifier)
+            return relation, client.get_table(table_ref)
+
+        tables = []
+        if relations:
+            pool = ThreadPool(min(len(relations), self.CATALOG_THREADS))
+            try:
+                tables = pool.map(get_table, relations)
+            finally:
+                pool.close()
+                pool.join()
+
+        for relation, table in tables:
+            flattened = self._flat_columns_in_table(table)
+            # the stats values are immutable, so every column of the relation
+            # can share them
+            relation_stats = dict(self._get_stats_columns(table,
+                                                          relation.type))
+
+            for index, column in enumerate(flattened, start=1):
+                column_data = (
+                    relation.schema,
+                    relation.name,
+                    relation.type,
+                    None,
+                    None,
+                    column.name,
+                    index,
+                    column.data_type,
+                    None,
+                )
+                column_dict = dict(zip(column_names, column_data))
+                column_dict.update(relation_stats)
+
+                columns.append(column_dict)
 
         return dbt.clients.agate_helper.table_from_data(columns, all_names)
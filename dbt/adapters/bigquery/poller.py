@@ -0,0 +1,66 @@
+from dbt.adapters.poller import Poller
+from dbt.logger import GLOBAL_LOGGER as logger
+
+
+class JobPoller(Poller):
+    """Waits for BigQuery jobs to finish with a single polling thread. When
+    several jobs are due to be checked at once, one jobs.list call finds the
+    finished ones instead of a jobs.get call per job.
+    """
+    name = 'bigquery-job-poller'
+
+    def __init__(self, *args, **kwargs):
+        super(JobPoller, self).__init__(*args, **kwargs)
+        self._can_list = True
+
+    def wait(self, job, client, timeout=None):
+        """Block until `job` is done or `timeout` seconds have passed. Return
+        True if the job is done.
+        """
+        if job.state == 'DONE':
+            return True
+        return self._wait((job, client), timeout)
+
+    def is_done(self, item):
+        job, client = item
+        job.reload(client=client)
+        return job.state == 'DONE'
+
+    def _check(self, due):
+        if len(due) > 1 and self._can_list:
+            try:
+                due = self._list_finished(due)
+            except Exception as e:
+                logger.debug('Could not list BigQuery jobs, checking them '
+                             'one at a time: {}'.format(e))
+                self._can_list = False
+
+        super(JobPoller, self)._check(due)
+
+    def _list_finished(self, due):
+        """Return the jobs in `due` that a jobs.list call reports as done."""
+        by_client = {}
+        for pending in due:
+            _, client = pending.item
+            by_client.setdefault(id(client), []).append(pending)
+
+        finished = []
+        for group in by_client.values():
+            _, client = group[0].item
+            waiting = {p.item[0].job_id: p for p in group}
+            created = [p.item[0].created for p in group]
+            oldest = None if None in created else min(created)
+
+            # jobs are listed newest first, so stop at the first one created
+            # before any of the jobs being waited on
+            for listed in client.list_jobs(state_filter='done'):
+                pending = waiting.pop(listed.job_id, None)
+                if pending is not None:
+                    finished.append(pending)
+                if not waiting:
+                    break
+                if (oldest is not None and listed.created is not None and
+                        listed.created < oldest):
+                    break
+
+        return finished
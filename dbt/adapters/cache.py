@@ -1,9 +1,12 @@
 from collections import namedtuple
+import json
+import logging
 import threading
 from copy import deepcopy
 import pprint
 from dbt.logger import CACHE_LOGGER as logger
 import dbt.exceptions
+import dbt.flags
 
 
 _ReferenceKey = namedtuple('_ReferenceKey', 'schema identifier')
@@ -24,10 +27,13 @@ class _CachedRelation(object):
     :attr str identifier: The identifier of this relation.
     :attr Dict[_ReferenceKey, _CachedRelation] referenced_by: The relations
         that refer to this relation.
+    :attr Set[_ReferenceKey] references: The relations that this relation
+        refers to, the reverse of referenced_by.
     :attr DefaultRelation inner: The underlying dbt relation.
     """
     def __init__(self, inner):
         self.referenced_by = {}
+        self.references = set()
         self.inner = inner
 
     def __str__(self):
@@ -52,6 +58,7 @@ class _CachedRelation(object):
         new = self.__class__(self.inner.incorporate())
         new.__dict__.update(self.__dict__)
         new.referenced_by = deepcopy(self.referenced_by, memo)
+        new.references = deepcopy(self.references, memo)
 
     def is_referenced_by(self, key):
         return key in self.referenced_by
@@ -70,6 +77,7 @@ class _CachedRelation(object):
         :param _CachedRelation referrer: The node that refers to this node.
         """
         self.referenced_by[referrer.key()] = referrer
+        referrer.references.add(self.key())
 
     def collect_consequences(self):
         """Recursively collect a set of _ReferenceKeys that would
@@ -150,11 +158,15 @@ class RelationsCache(object):
     :attr threading.RLock lock: The lock around relations, held during updates.
         The adapters also hold this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Dict[str, Dict[str, Dict[_ReferenceKey, _CachedRelation]]]
+        _schema_index: The known relations, by lowercased schema and then by
+        lowercased identifier.
     """
     def __init__(self):
         self.relations = {}
         self.lock = threading.RLock()
         self.schemas = set()
+        self._schema_index = {}
 
     def add_schema(self, schema):
         """Add a schema to the set of known schemas (case-insensitive)
@@ -192,6 +204,73 @@ class RelationsCache(object):
                 for k, v in self.relations.items()
             }
 
+    def _log_graph(self, message):
+        """Log a dump of the whole cache. Dumping walks every relation while
+        holding the lock, so it is only done when cache events are logged as
+        graph dumps.
+
+        :param str message: The message to prefix the dump with.
+        """
+        if not dbt.flags.LOG_CACHE_EVENTS:
+            return
+        if dbt.flags.CACHE_EVENT_FORMAT != 'graph':
+            return
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug('{}: {}'.format(message,
+                                     pprint.pformat(self.dump_graph())))
+
+    def _log_event(self, event, **kwargs):
+        """Log a single compact record of a change to the cache, if cache
+        events are logged in the compact format.
+
+        :param str event: The kind of change (add, link, drop or rename).
+        :param kwargs: The _ReferenceKeys (or lists of them) involved.
+        """
+        if not dbt.flags.LOG_CACHE_EVENTS:
+            return
+        if dbt.flags.CACHE_EVENT_FORMAT != 'compact':
+            return
+
+        def render(key):
+            return '.'.join(str(part) for part in key)
+
+        record = {'event': event}
+        for name, value in kwargs.items():
+            if isinstance(value, list):
+                record[name] = sorted(render(k) for k in value)
+            else:
+                record[name] = render(value)
+        logger.debug(json.dumps(record, sort_keys=True))
+
+    def _index_add(self, relation):
+        """Add a relation that was just stored in self.relations to the
+        schema index.
+
+        :param _CachedRelation relation: The relation to index.
+        """
+        schema = relation.schema.lower()
+        identifier = relation.identifier.lower()
+        identifiers = self._schema_index.setdefault(schema, {})
+        matches = identifiers.setdefault(identifier, {})
+        matches[relation.key()] = relation
+
+    def _index_remove(self, key):
+        """Remove a relation that was just removed from self.relations from
+        the schema index.
+
+        :param _ReferenceKey key: The key of the relation to remove.
+        """
+        schema = key.schema.lower()
+        identifier = key.identifier.lower()
+        identifiers = self._schema_index[schema]
+        matches = identifiers[identifier]
+        del matches[key]
+        if not matches:
+            del identifiers[identifier]
+        if not identifiers:
+            del self._schema_index[schema]
+
     def _setdefault(self, relation):
         """Add a relation to the cache, or return it if it already exists.
 
@@ -201,7 +280,10 @@ class RelationsCache(object):
         """
         self.schemas.add(relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        if key not in self.relations:
+            self.relations[key] = relation
+            self._index_add(relation)
+        return self.relations[key]
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -266,6 +348,7 @@ class RelationsCache(object):
         )
         with self.lock:
             self._add_link(referenced, dependent)
+        self._log_event('link', referenced=referenced, dependent=dependent)
 
     def add(self, relation):
         """Add the relation inner to the cache, under the schema schema and
@@ -275,14 +358,11 @@ class RelationsCache(object):
         """
         cached = _CachedRelation(relation)
         logger.debug('Adding relation: {!s}'.format(cached))
-        logger.debug('before adding: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('before adding')
         with self.lock:
             self._setdefault(cached)
-        logger.debug('after adding: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_event('add', relation=cached.key())
+        self._log_graph('after adding')
 
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
@@ -291,11 +371,20 @@ class RelationsCache(object):
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
         # remove direct refs
+        removed = []
         for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+            removed.append(self.relations.pop(key))
+            self._index_remove(key)
+        # then remove the references to them from the relations they refer to
+        # and from the relations that refer to them, if those remain
+        for relation in removed:
+            key = relation.key()
+            for referenced_key in relation.references:
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references([key])
+            for dependent in relation.referenced_by.values():
+                dependent.references.discard(key)
 
     def _drop_cascade_relation(self, dropped):
         """Drop the given relation and cascade it appropriately to all
@@ -312,6 +401,7 @@ class RelationsCache(object):
             'drop {} is cascading to {}'.format(dropped, consequences)
         )
         self._remove_refs(consequences)
+        self._log_event('drop', relation=dropped, cascade=list(consequences))
 
     def drop(self, relation):
         """Drop the named relation and cascade it appropriately to all
@@ -358,18 +448,25 @@ class RelationsCache(object):
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._index_remove(old_key)
 
         relation.rename(new_key)
-        # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        # update all the relations that it refers to
+        for referenced_key in relation.references:
+            cached = self.relations.get(referenced_key)
+            if cached is not None and cached.is_referenced_by(old_key):
                 logger.debug(
                     'updated reference from {0} -> {2} to {1} -> {2}'
                     .format(old_key, new_key, cached.key())
                 )
                 cached.rename_key(old_key, new_key)
+        # and all the relations that refer to it
+        for dependent in relation.referenced_by.values():
+            dependent.references.discard(old_key)
+            dependent.references.add(new_key)
 
         self.relations[new_key] = relation
+        self._index_add(relation)
 
     def rename(self, old, new):
         """Rename the old schema/identifier to the new schema/identifier and
@@ -394,28 +491,32 @@ class RelationsCache(object):
         logger.debug('Renaming relation {!s} to {!s}'.format(
             old_key, new_key)
         )
-        logger.debug('before rename: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('before rename')
         with self.lock:
             self._rename_relation(old_key, new_key)
-        logger.debug('after rename: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_event('rename', old=old_key, new=new_key)
+        self._log_graph('after rename')
 
-    def get_relations(self, schema):
-        """Case-insensitively yield all relations matching the given schema.
+    def get_relations(self, schema, identifier=None):
+        """Case-insensitively yield all relations matching the given schema,
+        and the given identifier if there is one.
 
         :param str schema: The case-insensitive schema name to list from.
+        :param Optional[str] identifier: The case-insensitive identifier to
+            look up.
         :return List[DefaultRelation]: The list of relations with the given
             schema
         """
-        schema = schema.lower()
         with self.lock:
-            results = [
-                r.inner for r in self.relations.values()
-                if r.schema.lower() == schema
-            ]
+            identifiers = self._schema_index.get(schema.lower(), {})
+            if identifier is None:
+                results = [
+                    r.inner for matches in identifiers.values()
+                    for r in matches.values()
+                ]
+            else:
+                matches = identifiers.get(identifier.lower(), {})
+                results = [r.inner for r in matches.values()]
 
         if None in results:
             dbt.exceptions.raise_cache_inconsistent(
@@ -428,3 +529,71 @@ class RelationsCache(object):
         with self.lock:
             self.relations.clear()
             self.schemas.clear()
+            self._schema_index.clear()
+
+
+class ColumnCache(object):
+    """A cache of the columns in relations, filled as dbt looks them up.
+
+    Entries are keyed by (database, schema, identifier) exactly as they were
+    looked up. Invalidation is case-insensitive and also removes lookups that
+    were made without a schema, so it errs on the side of querying again.
+    Empty results are never cached, as they usually mean that the relation
+    does not exist yet.
+
+    :attr threading.RLock lock: The lock around the cached columns.
+    :attr Dict[Tuple[str, str, str], List[Column]] columns: The cached
+        columns.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.columns = {}
+        self._keys_by_identifier = {}
+
+    def get(self, database, schema, identifier):
+        """Get the cached columns of a relation.
+
+        :return Optional[List[Column]]: The columns, or None if they are not
+            cached.
+        """
+        with self.lock:
+            columns = self.columns.get((database, schema, identifier))
+        if columns is None:
+            return None
+        return list(columns)
+
+    def set(self, database, schema, identifier, columns):
+        """Cache the columns of a relation.
+
+        :param List[Column] columns: The columns in the relation.
+        """
+        if not columns:
+            return
+        key = (database, schema, identifier)
+        with self.lock:
+            self.columns[key] = list(columns)
+            self._keys_by_identifier.setdefault(identifier.lower(),
+                                                set()).add(key)
+
+    def invalidate(self, schema, identifier):
+        """Forget the columns of a relation that is being changed.
+
+        :param Optional[str] schema: The schema of the relation.
+        :param str identifier: The identifier of the relation.
+        """
+        if identifier is None:
+            return
+        with self.lock:
+            keys = self._keys_by_identifier.get(identifier.lower(), set())
+            for key in list(keys):
+                cached_schema = key[1]
+                if schema is None or cached_schema is None or \
+                   cached_schema.lower() == schema.lower():
+                    keys.discard(key)
+                    self.columns.pop(key, None)
+
+    def clear(self):
+        """Clear the cache"""
+        with self.lock:
+            self.columns.clear()
+            self._keys_by_identifier.clear()
@@ -1,9 +1,10 @@
 import copy
-import multiprocessing
+import threading
 import time
 import agate
 
 from contextlib import contextmanager
+from multiprocessing.dummy import Pool as ThreadPool
 
 import dbt.exceptions
 import dbt.flags
@@ -16,13 +17,14 @@ from dbt.schema import Column
 from dbt.utils import filter_null_values
 
 from dbt.adapters.default.relation import DefaultRelation
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import RelationsCache, ColumnCache
+from dbt.adapters.pool import ConnectionPool
 
 GET_CATALOG_OPERATION_NAME = 'get_catalog_data'
 
-lock = multiprocessing.Lock()
-connections_in_use = {}
-connections_available = []
+# how long to wait for another thread to release a connection when the pool is
+# full, unless the profile says otherwise.
+DEFAULT_ACQUIRE_TIMEOUT = 60
 
 
 def _expect_row_value(key, row):
@@ -68,11 +70,15 @@ class DefaultAdapter(object):
 
     config_functions = [
         "get_columns_in_table",
+        "get_columns_in_relations",
         "get_missing_columns",
         "expand_target_column_types",
         "create_schema",
         "quote_as_configured",
         "cache_new_relation",
+        "clear_cached_columns",
+        "begin_ddl_batch",
+        "flush_ddl_batch",
 
         # deprecated -- use versions that take relations instead
         "already_exists",
@@ -107,6 +113,12 @@ class DefaultAdapter(object):
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
+        self.column_cache = ColumnCache()
+        self.connections_in_use = {}
+        self.connection_lock = threading.RLock()
+        self.pool = self._make_connection_pool()
+        # connection name -> list of (sql, auto_begin) waiting to be flushed
+        self.ddl_batches = {}
 
     ###
     # ADAPTER-SPECIFIC FUNCTIONS -- each of these must be overridden in
@@ -173,6 +185,14 @@ class DefaultAdapter(object):
             )
         if dbt.flags.USE_CACHE:
             self.cache.add(relation)
+        self.column_cache.invalidate(relation.schema, relation.identifier)
+        # so jinja doesn't render things
+        return ''
+
+    def clear_cached_columns(self, relation, model_name=None):
+        """Forget the cached columns of a relation. Macros that change the
+        columns of a relation directly should call this."""
+        self.column_cache.invalidate(relation.schema, relation.identifier)
         # so jinja doesn't render things
         return ''
 
@@ -202,6 +222,7 @@ class DefaultAdapter(object):
     def drop_relation(self, relation, model_name=None):
         if dbt.flags.USE_CACHE:
             self.cache.drop(relation)
+        self.column_cache.invalidate(relation.schema, relation.identifier)
         if relation.type is None:
             dbt.exceptions.raise_compiler_error(
                 'Tried to drop relation {}, but its type is null.'
@@ -209,7 +230,7 @@ class DefaultAdapter(object):
 
         sql = 'drop {} if exists {} cascade'.format(relation.type, relation)
 
-        connection, cursor = self.add_query(sql, model_name, auto_begin=False)
+        self.add_ddl_query(sql, model_name, auto_begin=False)
 
     def truncate(self, schema, table, model_name=None):
         relation = self.Relation.create(
@@ -221,6 +242,7 @@ class DefaultAdapter(object):
         return self.truncate_relation(relation, model_name)
 
     def truncate_relation(self, relation, model_name=None):
+        self.column_cache.invalidate(relation.schema, relation.identifier)
         sql = 'truncate table {}'.format(relation)
 
         connection, cursor = self.add_query(sql, model_name)
@@ -245,10 +267,52 @@ class DefaultAdapter(object):
                         model_name=None):
         if dbt.flags.USE_CACHE:
             self.cache.rename(from_relation, to_relation)
+        self._invalidate_renamed_columns(from_relation, to_relation)
         sql = 'alter table {} rename to {}'.format(
             from_relation, to_relation.include(schema=False))
 
-        connection, cursor = self.add_query(sql, model_name)
+        self.add_ddl_query(sql, model_name)
+
+    def begin_ddl_batch(self, model_name=None):
+        """Hold back the DDL that drop_relation and rename_relation run on
+        this connection until flush_ddl_batch is called, so that it reaches
+        the database in a single round-trip. The relations cache is still
+        updated as each relation is dropped or renamed."""
+        connection = self.get_connection(model_name)
+        self.ddl_batches[connection.name] = []
+        # so jinja doesn't render things
+        return ''
+
+    def flush_ddl_batch(self, model_name=None):
+        """Run the DDL held back since begin_ddl_batch and stop batching."""
+        connection = self.get_connection(model_name)
+        batch = self.ddl_batches.pop(connection.name, None)
+
+        if batch:
+            queries = [sql for sql, _ in batch]
+            auto_begin = any(begin for _, begin in batch)
+            if len(queries) == 1:
+                sql = queries[0]
+            else:
+                sql = self.batch_ddl_sql(queries)
+            self.add_query(sql, model_name, auto_begin=auto_begin)
+        # so jinja doesn't render things
+        return ''
+
+    @classmethod
+    def batch_ddl_sql(cls, queries):
+        """Return the sql that runs all of the given DDL statements in one
+        request."""
+        return ';\n'.join(queries)
+
+    def add_ddl_query(self, sql, model_name=None, auto_begin=True):
+        connection = self.get_connection(model_name)
+        batch = self.ddl_batches.get(connection.name)
+
+        if batch is None:
+            self.add_query(sql, model_name, auto_begin=auto_begin)
+        else:
+            batch.append((sql, auto_begin))
 
     @classmethod
     def is_cancelable(cls):
@@ -301,8 +365,113 @@ class DefaultAdapter(object):
 
         return sql
 
+    def _invalidate_renamed_columns(self, from_relation, to_relation):
+        self.column_cache.invalidate(from_relation.schema,
+                                     from_relation.identifier)
+        self.column_cache.invalidate(to_relation.schema,
+                                     to_relation.identifier)
+
+    @classmethod
+    def _get_columns_in_tables_sql(cls, schema_name, table_names):
+        schema_filter = '1=1'
+        if schema_name is not None:
+            schema_filter = "table_schema = '{}'".format(schema_name)
+
+        table_list = ', '.join("'{}'".format(t) for t in table_names)
+
+        sql = """
+        select
+            table_name,
+            column_name,
+            data_type,
+            character_maximum_length,
+            numeric_precision || ',' || numeric_scale as numeric_size
+
+        from information_schema.columns
+        where table_name in ({table_list})
+          and {schema_filter}
+        order by table_name, ordinal_position
+        """.format(table_list=table_list,
+                   schema_filter=schema_filter).strip()
+
+        return sql
+
+    def _get_columns_in_tables(self, schema_name, table_names,
+                               model_name=None):
+        """Look up the columns in several tables of one schema with a
+        single query.
+
+        :return Dict[str, List[Column]]: The columns in each of the tables
+            that has any.
+        """
+        sql = self._get_columns_in_tables_sql(schema_name, table_names)
+        connection, cursor = self.add_query(sql, model_name)
+
+        # some databases don't return names in the case they were asked for
+        lowered = {t.lower(): t for t in table_names}
+        results = {}
+
+        for row in cursor.fetchall():
+            table_name, name, data_type, char_size, numeric_size = row
+            if table_name not in table_names:
+                table_name = lowered.get(table_name.lower())
+                if table_name is None:
+                    continue
+            column = self.Column(name, data_type, char_size, numeric_size)
+            results.setdefault(table_name, []).append(column)
+
+        return results
+
+    def get_columns_in_relations(self, relations, model_name=None):
+        """Return a list of the columns in each of the given relations, in
+        the same order. Relations whose columns are not cached are looked up
+        with one query per schema, and their columns are cached.
+        """
+        results = [None] * len(relations)
+        missing = {}
+
+        for i, relation in enumerate(relations):
+            columns = None
+            if dbt.flags.USE_CACHE:
+                columns = self.column_cache.get(None, relation.schema,
+                                                relation.identifier)
+            if columns is None:
+                missing.setdefault(relation.schema, []).append(i)
+            else:
+                results[i] = columns
+
+        for schema, indices in missing.items():
+            table_names = []
+            for i in indices:
+                if relations[i].identifier not in table_names:
+                    table_names.append(relations[i].identifier)
+
+            found = self._get_columns_in_tables(schema, table_names,
+                                                model_name)
+            for table_name, columns in found.items():
+                if dbt.flags.USE_CACHE:
+                    self.column_cache.set(None, schema, table_name, columns)
+
+            for i in indices:
+                results[i] = list(found.get(relations[i].identifier, []))
+
+        return results
+
     def get_columns_in_table(self, schema_name,
                              table_name, database=None, model_name=None):
+        if dbt.flags.USE_CACHE:
+            columns = self.column_cache.get(database, schema_name, table_name)
+            if columns is not None:
+                return columns
+
+        columns = self._get_columns_in_table(schema_name, table_name,
+                                             database, model_name)
+        if dbt.flags.USE_CACHE:
+            self.column_cache.set(database, schema_name, table_name, columns)
+        return columns
+
+    def _get_columns_in_table(self, schema_name, table_name, database=None,
+                              model_name=None):
         sql = self._get_columns_in_table_sql(schema_name, table_name, database)
         connection, cursor = self.add_query(sql, model_name)
 
@@ -372,6 +541,39 @@ class DefaultAdapter(object):
         raise dbt.exceptions.NotImplementedException(
             '`list_relations` is not implemented for this adapter!')
 
+    def _list_relations_in_schemas(self, schemas, model_name=None):
+        """Return the relations in all of the given schemas. Adapters that
+        can list many schemas in a single query should override this.
+        """
+        return self._list_relations_in_parallel(schemas, model_name)
+
+    def _list_relations_in_parallel(self, schemas, model_name=None):
+        """List each schema with _list_relations on its own connection, in
+        parallel.
+        """
+        schemas = list(schemas)
+        if len(schemas) <= 1:
+            return [
+                relation for schema in schemas
+                for relation in self._list_relations(schema, model_name)
+            ]
+
+        def list_schema(schema):
+            connection_name = 'list_{}'.format(schema)
+            try:
+                return self._list_relations(schema, connection_name)
+            finally:
+                self.release_connection(connection_name)
+
+        pool = ThreadPool(min(len(schemas), self.config.threads))
+        try:
+            results = pool.map(list_schema, schemas)
+        finally:
+            pool.close()
+            pool.join()
+
+        return [relation for relations in results for relation in relations]
+
     def list_relations(self, schema, model_name=None):
         if self._schema_is_cached(schema, model_name):
             return self.cache.get_relations(schema)
@@ -408,7 +610,11 @@ class DefaultAdapter(object):
         return matches
 
     def get_relation(self, schema, identifier, model_name=None):
-        relations_list = self.list_relations(schema, model_name)
+        if self._schema_is_cached(schema, model_name, debug_on_missing=False):
+            # only relations with the same name (ignoring case) can match
+            relations_list = self.cache.get_relations(schema, identifier)
+        else:
+            relations_list = self.list_relations(schema, model_name)
 
         matches = self._make_match(relations_list, schema, identifier)
 
@@ -443,16 +649,35 @@ class DefaultAdapter(object):
     def get_default_schema(self):
         return self.config.credentials.schema
 
-    def get_connection(self, name=None, recache_if_missing=True):
-        global connections_in_use
+    def _make_connection_pool(self):
+        settings = self.config.credentials.get('connection_pool', {})
+        # by default we add a magic number, 2 because there are overhead
+        # connections, one for pre- and post-run hooks and other misc
+        # operations that occur before the run starts, and one for
+        # integration tests.
+        max_size = settings.get('max_size', self.config.threads + 2)
+        self.pre_ping = settings.get('pre_ping', False)
+
+        return ConnectionPool(
+            open_fn=self._open_new_connection,
+            close_fn=self.close,
+            check_fn=self.check_connection,
+            max_size=max_size,
+            min_size=settings.get('min_size', 0),
+            idle_timeout=settings.get('idle_timeout'),
+            acquire_timeout=settings.get('acquire_timeout',
+                                         DEFAULT_ACQUIRE_TIMEOUT)
+        )
 
+    def get_connection(self, name=None, recache_if_missing=True):
         if name is None:
             # if a name isn't specified, we'll re-use a single handle
             # named 'master'
             name = 'master'
 
-        if connections_in_use.get(name):
-            return connections_in_use.get(name)
+        connection = self.connections_in_use.get(name)
+        if connection:
+            return connection
 
         if not recache_if_missing:
             raise dbt.exceptions.InternalException(
@@ -463,91 +688,101 @@ class DefaultAdapter(object):
                      .format(self.type(), name))
 
         connection = self.acquire_connection(name)
-        connections_in_use[name] = connection
+        with self.connection_lock:
+            self.connections_in_use[name] = connection
 
         return self.get_connection(name)
 
     def cancel_open_connections(self):
-        global connections_in_use
+        with self.connection_lock:
+            in_use = list(self.connections_in_use.items())
 
-        for name, connection in connections_in_use.items():
+        for name, connection in in_use:
             if name == 'master':
                 continue
 
             self.cancel_connection(connection)
             yield name
 
-    @classmethod
-    def total_connections_allocated(cls):
-        global connections_in_use, connections_available
+    def total_connections_allocated(self):
+        return self.pool.allocated
+
+    def _open_new_connection(self, name):
+        result = Connection(
+            type=self.type(),
+            name=name,
+            state='init',
+            transaction_open=False,
+            handle=None,
+            credentials=self.config.credentials
+        )
 
-        return len(connections_in_use) + len(connections_available)
+        return self.open_connection(result)
 
     def acquire_connection(self, name):
-        global connections_available, lock
-
-        # we add a magic number, 2 because there are overhead connections,
-        # one for pre- and post-run hooks and other misc operations that occur
-        # before the run starts, and one for integration tests.
-        max_connections = self.config.threads + 2
-
-        with lock:
-            num_allocated = self.total_connections_allocated()
-
-            if len(connections_available) > 0:
-                logger.debug('Re-using an available connection from the pool.')
-                to_return = connections_available.pop()
-                to_return.name = name
-                return to_return
-
-            elif num_allocated >= max_connections:
-                raise dbt.exceptions.InternalException(
-                    'Tried to request a new connection "{}" but '
-                    'the maximum number of connections are already '
-                    'allocated!'.format(name))
-
-            logger.debug('Opening a new connection ({} currently allocated)'
-                         .format(num_allocated))
-
-            result = Connection(
-                type=self.type(),
-                name=name,
-                state='init',
-                transaction_open=False,
-                handle=None,
-                credentials=self.config.credentials
-            )
+        return self.pool.acquire(name)
 
-            return self.open_connection(result)
+    def warm_up_connections(self, count):
+        """Open up to `count` connections concurrently so that they are
+        ready before they are needed. Return the number of connections that
+        were opened.
+        """
+        return self.pool.fill(count)
 
-    def release_connection(self, name):
-        global connections_in_use, connections_available, lock
+    def check_connection(self, connection):
+        """Return True if the idle connection can be handed out again. If the
+        profile sets `pre_ping`, this runs a trivial query on the connection
+        first.
+        """
+        if connection.state != 'open':
+            return False
+
+        if not self.pre_ping:
+            return True
+
+        try:
+            self.ping_connection(connection)
+        except Exception as e:
+            logger.debug('Connection failed its health check: {}'.format(e))
+            return False
+        return True
 
-        with lock:
+    @classmethod
+    def ping_connection(cls, connection):
+        handle = connection.handle
+        cursor = handle.cursor()
+        try:
+            cursor.execute('select 1')
+            cursor.fetchall()
+        finally:
+            cursor.close()
 
-            if name not in connections_in_use:
+        # the ping opens an implicit transaction unless the handle commits
+        # every statement, so close it before the connection is handed out
+        if getattr(handle, 'autocommit', False) is not True:
+            handle.rollback()
+
+    def release_connection(self, name):
+        with self.connection_lock:
+            if name not in self.connections_in_use:
                 return
 
             to_release = self.get_connection(name, recache_if_missing=False)
 
-            if to_release.state == 'open':
-
-                if to_release.transaction_open is True:
-                    self.rollback(to_release)
+        # ddl that was never flushed belongs to a failed materialization
+        self.ddl_batches.pop(name, None)
 
-                to_release.name = None
-                connections_available.append(to_release)
-            else:
-                self.close(to_release)
+        if to_release.state == 'open' and to_release.transaction_open is True:
+            self.rollback(to_release)
 
-            del connections_in_use[name]
+        with self.connection_lock:
+            del self.connections_in_use[name]
 
-    @classmethod
-    def cleanup_connections(cls):
-        global connections_in_use, connections_available, lock
+        self.pool.release(to_release)
 
-        with lock:
-            for name, connection in connections_in_use.items():
+    def cleanup_connections(self):
+        with self.connection_lock:
+            for name, connection in self.connections_in_use.items():
                 if connection.get('state') != 'closed':
                     logger.debug("Connection '{}' was left open."
                                  .format(name))
@@ -555,13 +790,12 @@ class DefaultAdapter(object):
                     logger.debug("Connection '{}' was properly closed."
                                  .format(name))
 
-            conns_in_use = list(connections_in_use.values())
-            for conn in conns_in_use + connections_available:
-                cls.close(conn)
+            conns_in_use = list(self.connections_in_use.values())
+            self.connections_in_use = {}
 
-            # garbage collect these connections
-            connections_in_use = {}
-            connections_available = []
+        for conn in conns_in_use:
+            self.pool.discard(conn)
+        self.pool.close_idle()
 
     def reload(self, connection):
         return self.get_connection(connection.name)
@@ -573,7 +807,6 @@ class DefaultAdapter(object):
         return self.add_query('COMMIT', name, auto_begin=False)
 
     def begin(self, name):
-        global connections_in_use
         connection = self.get_connection(name)
 
         if dbt.flags.STRICT_MODE:
@@ -587,17 +820,16 @@ class DefaultAdapter(object):
         self.add_begin_query(name)
 
         connection.transaction_open = True
-        connections_in_use[name] = connection
+        self.connections_in_use[name] = connection
 
         return connection
 
     def commit_if_has_connection(self, name):
-        global connections_in_use
 
         if name is None:
             name = 'master'
 
-        if connections_in_use.get(name) is None:
+        if self.connections_in_use.get(name) is None:
             return
 
         connection = self.get_connection(name, False)
@@ -605,11 +837,12 @@ class DefaultAdapter(object):
         return self.commit(connection)
 
     def commit(self, connection):
-        global connections_in_use
 
         if dbt.flags.STRICT_MODE:
             assert isinstance(connection, Connection)
 
+        # batched ddl is part of the transaction being committed
+        self.flush_ddl_batch(connection.name)
         connection = self.reload(connection)
 
         if connection.transaction_open is False:
@@ -621,7 +854,7 @@ class DefaultAdapter(object):
         self.add_commit_query(connection.name)
 
         connection.transaction_open = False
-        connections_in_use[connection.name] = connection
+        self.connections_in_use[connection.name] = connection
 
         return connection
 
@@ -640,7 +873,7 @@ class DefaultAdapter(object):
         connection.handle.rollback()
 
         connection.transaction_open = False
-        connections_in_use[connection.name] = connection
+        self.connections_in_use[connection.name] = connection
 
         return connection
 
@@ -675,14 +908,21 @@ class DefaultAdapter(object):
                 logger.debug('On %s: %s', connection_name, sql)
             pre = time.time()
 
-            cursor = connection.handle.cursor()
-            cursor.execute(sql, bindings)
+            cursor = self._execute_on_connection(connection, sql, bindings)
 
             logger.debug("SQL status: %s in %0.2f seconds",
                          self.get_status(cursor), (time.time() - pre))
 
             return connection, cursor
 
+    def _execute_on_connection(self, connection, sql, bindings=None):
+        """Run a single statement on a new cursor of the connection and
+        return the cursor once the statement has finished.
+        """
+        cursor = connection.handle.cursor()
+        cursor.execute(sql, bindings)
+        return cursor
+
     def clear_transaction(self, conn_name='master'):
         conn = self.begin(conn_name)
         self.commit(conn)
@@ -863,12 +1103,9 @@ class DefaultAdapter(object):
         if schemas is None:
             schemas = manifest.get_used_schemas()
 
-        relations = []
-        # add all relations
-        for schema in schemas:
-            # bypass the cache, of course!
-            for relation in self._list_relations(schema):
-                self.cache.add(relation)
+        # add all relations, bypassing the cache of course!
+        for relation in self._list_relations_in_schemas(schemas):
+            self.cache.add(relation)
         self._link_cached_relations(manifest, schemas)
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
@@ -885,4 +1122,5 @@ class DefaultAdapter(object):
         with self.cache.lock:
             if clear:
                 self.cache.clear()
+                self.column_cache.clear()
             self._relations_cache_for_schemas(manifest)
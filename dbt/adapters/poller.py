@@ -0,0 +1,110 @@
+import threading
+import time
+
+
+class _Pending(object):
+    def __init__(self, item, interval):
+        self.item = item
+        self.interval = interval
+        self.next_check = time.time() + interval
+        self.done = False
+        self.error = None
+        self.finished = threading.Event()
+
+
+class Poller(object):
+    """Waits for remote work, like warehouse jobs or queries, to finish on
+    behalf of any number of threads, with a single polling thread.
+
+    Each item is first checked after `min_interval` seconds, and the time
+    between checks grows by a factor of `backoff` up to `max_interval`, so
+    short work finishes with little added latency and long-running work
+    costs few status checks. Subclasses implement is_done, and may override
+    _check to look at several due items at once.
+    """
+    name = 'poller'
+
+    def __init__(self, min_interval=0.05, max_interval=2.0, backoff=1.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._pending = []
+        self._condition = threading.Condition(threading.Lock())
+        self._thread = None
+
+    def is_done(self, item):
+        """Return True if the given item has finished."""
+        raise NotImplementedError('is_done is not implemented')
+
+    def _wait(self, item, timeout=None):
+        """Block until `item` is done or `timeout` seconds have passed. Return
+        True if the item is done. Errors raised while checking on the item
+        are raised here.
+        """
+        pending = _Pending(item, self.min_interval)
+        with self._condition:
+            self._pending.append(pending)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name=self.name)
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+        finished = pending.finished.wait(timeout)
+
+        with self._condition:
+            if pending in self._pending:
+                self._pending.remove(pending)
+
+        if pending.error is not None:
+            raise pending.error
+        return finished
+
+    def _next_due(self):
+        """Wait until at least one item is due to be checked and return the
+        due items, or return None if there is nothing left to wait for. Must
+        be called with the lock held.
+        """
+        while self._pending:
+            now = time.time()
+            next_check = min(p.next_check for p in self._pending)
+            if next_check <= now:
+                # check items that are almost due along with the due ones, so
+                # that subclasses can check them together
+                cutoff = now + self.min_interval
+                return [p for p in self._pending if p.next_check <= cutoff]
+            self._condition.wait(next_check - now)
+        return None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                due = self._next_due()
+                if due is None:
+                    self._thread = None
+                    return
+
+            self._check(due)
+
+            with self._condition:
+                for pending in due:
+                    if pending.done or pending.error is not None:
+                        if pending in self._pending:
+                            self._pending.remove(pending)
+                        pending.finished.set()
+                    else:
+                        pending.interval = min(
+                            pending.interval * self.backoff,
+                            self.max_interval)
+                        pending.next_check = time.time() + pending.interval
+
+    def _check(self, due):
+        """Set `done` or `error` on each of the due items that has finished
+        or failed.
+        """
+        for pending in due:
+            try:
+                pending.done = self.is_done(pending.item)
+            except Exception as e:
+                pending.error = e
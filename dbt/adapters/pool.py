@@ -0,0 +1,211 @@
+import threading
+import time
+
+import dbt.exceptions
+from dbt.logger import GLOBAL_LOGGER as logger
+
+from multiprocessing.dummy import Pool as ThreadPool
+
+
+class ConnectionPool(object):
+    """A thread-safe pool of warehouse connections, owned by one adapter.
+
+    The pool only tracks idle connections and a count of everything it has
+    handed out; the adapter decides what a connection is and what to do with
+    it while it is checked out.
+
+    :param Callable[[str], Connection] open_fn: Create and open a new
+        connection with the given name.
+    :param Callable[[Connection], Any] close_fn: Close a connection.
+    :param Callable[[Connection], bool] check_fn: Return True if an idle
+        connection can safely be handed out again.
+    :param int max_size: The maximum number of connections that may be
+        allocated (checked out or idle) at once.
+    :param int min_size: Idle connections are never evicted below this count.
+    :param Optional[float] idle_timeout: If set, idle connections older than
+        this many seconds are closed instead of being reused.
+    :param Optional[float] acquire_timeout: How long to wait for a connection
+        to be released when the pool is at max_size. If None, wait forever.
+    """
+    def __init__(self, open_fn, close_fn, check_fn, max_size, min_size=0,
+                 idle_timeout=None, acquire_timeout=None):
+        self.open_fn = open_fn
+        self.close_fn = close_fn
+        self.check_fn = check_fn
+        self.max_size = max_size
+        self.min_size = min_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        # (connection, time it was released) pairs, most recent last
+        self._idle = []
+        self._allocated = 0
+        self._condition = threading.Condition(threading.Lock())
+
+    @property
+    def allocated(self):
+        """The number of connections checked out of the pool plus the number
+        of idle connections it holds.
+        """
+        return self._allocated
+
+    @property
+    def idle(self):
+        return len(self._idle)
+
+    def _pop_expired(self):
+        """Remove idle connections that have outlived idle_timeout from the
+        pool and return them. Must be called with the lock held.
+        """
+        if self.idle_timeout is None:
+            return []
+
+        cutoff = time.time() - self.idle_timeout
+        expired = []
+        # the oldest connections are at the front of the list
+        while len(self._idle) > self.min_size and self._idle[0][1] < cutoff:
+            connection, _ = self._idle.pop(0)
+            expired.append(connection)
+        self._allocated -= len(expired)
+        return expired
+
+    def _close_all(self, connections):
+        for connection in connections:
+            try:
+                self.close_fn(connection)
+            except Exception as e:
+                logger.debug('Error closing connection: {}'.format(e))
+
+    def _checkout(self, name):
+        """Wait until an idle connection is available or a new one may be
+        opened. Return a (connection, expired) pair, where connection is None
+        if the caller should open a new connection and expired is a list of
+        connections the caller should close.
+        """
+        deadline = None
+        if self.acquire_timeout is not None:
+            deadline = time.time() + self.acquire_timeout
+
+        with self._condition:
+            while True:
+                expired = self._pop_expired()
+
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    return connection, expired
+
+                if self._allocated < self.max_size:
+                    self._allocated += 1
+                    return None, expired
+
+                if deadline is None:
+                    remaining = None
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise dbt.exceptions.InternalException(
+                            'Tried to request a new connection "{}" but '
+                            'the maximum number of connections ({}) were '
+                            'still allocated after waiting {}s!'
+                            .format(name, self.max_size,
+                                    self.acquire_timeout))
+
+                logger.debug('Waiting for a connection to be released '
+                             '({} currently allocated)'
+                             .format(self._allocated))
+                self._condition.wait(remaining)
+
+    def acquire(self, name):
+        """Return an open connection with the given name, re-using an idle
+        one if a healthy one is available.
+        """
+        while True:
+            connection, expired = self._checkout(name)
+            self._close_all(expired)
+
+            if connection is None:
+                logger.debug('Opening a new connection ({} currently '
+                             'allocated)'.format(self._allocated - 1))
+                try:
+                    connection = self.open_fn(name)
+                except BaseException:
+                    self._forget()
+                    raise
+                return connection
+
+            if self.check_fn(connection):
+                logger.debug('Re-using an available connection from the '
+                             'pool.')
+                connection.name = name
+                return connection
+
+            logger.debug('Discarding a stale connection from the pool.')
+            self.discard(connection)
+
+    def release(self, connection):
+        """Return a connection to the pool. Connections that are not open are
+        closed instead of being kept for re-use.
+        """
+        if connection.state != 'open':
+            self.discard(connection)
+            return
+
+        connection.name = None
+        with self._condition:
+            self._idle.append((connection, time.time()))
+            expired = self._pop_expired()
+            self._condition.notify()
+        self._close_all(expired)
+
+    def discard(self, connection):
+        """Close a connection that was checked out of the pool and free up its
+        slot.
+        """
+        self._close_all([connection])
+        self._forget()
+
+    def _forget(self):
+        with self._condition:
+            self._allocated -= 1
+            self._condition.notify()
+
+    def _open_idle(self, _):
+        try:
+            connection = self.open_fn(None)
+        except Exception as e:
+            logger.debug('Could not open a connection ahead of time: {}'
+                         .format(e))
+            self._forget()
+            return 0
+
+        opened = connection.state == 'open'
+        self.release(connection)
+        return int(opened)
+
+    def fill(self, count):
+        """Open new connections in parallel until `count` connections are
+        idle, without allocating more than max_size. Connections that fail to
+        open are skipped, so the error surfaces when the connection is really
+        needed. Return the number of connections opened.
+        """
+        with self._condition:
+            needed = min(count - len(self._idle),
+                         self.max_size - self._allocated)
+            if needed <= 0:
+                return 0
+            self._allocated += needed
+
+        workers = ThreadPool(needed)
+        try:
+            return sum(workers.map(self._open_idle, range(needed)))
+        finally:
+            workers.close()
+            workers.join()
+
+    def close_idle(self):
+        """Close every idle connection in the pool."""
+        with self._condition:
+            idle = [connection for connection, _ in self._idle]
+            self._idle = []
+            self._allocated -= len(idle)
+            self._condition.notify_all()
+        self._close_all(idle)
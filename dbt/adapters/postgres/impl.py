@@ -1,4 +1,6 @@
+import datetime
 import psycopg2
+import time
 
 from contextlib import contextmanager
 
@@ -13,10 +15,59 @@ from dbt.logger import GLOBAL_LOGGER as logger
 GET_RELATIONS_OPERATION_NAME = 'get_relations_data'
 
 
+def _copy_field(value):
+    """Render one agate value as a csv field for COPY. Nulls are the only
+    values written as unquoted empty fields, so COPY reads nothing else as
+    null."""
+    if value is None:
+        return ''
+    elif isinstance(value, bool):
+        value = 'true' if value else 'false'
+    elif isinstance(value, datetime.date):
+        value = value.isoformat()
+    else:
+        value = dbt.compat.to_string(value)
+    return '"{}"'.format(value.replace('"', '""'))
+
+
+class _CopyRows(object):
+    """A readable file of agate rows rendered as csv, for COPY ... FROM
+    STDIN. Rows are rendered as they are read, so a seed is never held in
+    memory all at once."""
+    def __init__(self, rows):
+        self._lines = (
+            (u','.join(_copy_field(value) for value in row) + u'\n')
+            .encode('utf-8')
+            for row in rows
+        )
+        self._buffer = b''
+
+    def read(self, size=-1):
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+
+        data = b''.join(chunks)
+        if size < 0:
+            self._buffer = b''
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
 class PostgresAdapter(dbt.adapters.default.DefaultAdapter):
 
     DEFAULT_TCP_KEEPALIVE = 0  # 0 means to use the default value
 
+    config_functions = dbt.adapters.default.DefaultAdapter.config_functions + [
+        "copy_from_csv",
+    ]
+
     @contextmanager
     def exception_handler(self, sql, model_name=None, connection_name=None):
         try:
@@ -128,6 +179,8 @@ class PostgresAdapter(dbt.adapters.default.DefaultAdapter):
             quote_policy=self.config.quoting
         )
 
+        self.column_cache.invalidate(schema, table)
+
         opts = {
             "relation": relation,
             "old_column": column_name,
@@ -161,13 +214,21 @@ class PostgresAdapter(dbt.adapters.default.DefaultAdapter):
             self.cache.add_link(dependent, referenced)
 
     def _list_relations(self, schema, model_name=None):
+        return self._list_relations_in_schemas([schema], model_name)
+
+    def _list_relations_in_schemas(self, schemas, model_name=None):
+        schemas = list(schemas)
+        if not schemas:
+            return []
+
+        schema_list = ', '.join("'{}'".format(s.lower()) for s in schemas)
         sql = """
         select tablename as name, schemaname as schema, 'table' as type from pg_tables
-        where schemaname ilike '{schema}'
+        where lower(schemaname) in ({schemas})
         union all
         select viewname as name, schemaname as schema, 'view' as type from pg_views
-        where schemaname ilike '{schema}'
-        """.format(schema=schema).strip()  # noqa
+        where lower(schemaname) in ({schemas})
+        """.format(schemas=schema_list).strip()  # noqa
 
         connection, cursor = self.add_query(sql, model_name, auto_begin=False)
 
@@ -203,6 +264,36 @@ class PostgresAdapter(dbt.adapters.default.DefaultAdapter):
 
         return results[0] > 0
 
+    def copy_from_csv(self, relation, agate_table, model_name=None):
+        """Load the rows of agate_table into relation with COPY ... FROM
+        STDIN, streaming the values agate cast instead of building INSERT
+        statements. Return the COPY statement that was run.
+        """
+        cols_sql = ', '.join(agate_table.column_names)
+        sql = 'copy {} ({}) from stdin with csv'.format(
+            relation.render(False), cols_sql)
+
+        connection = self.get_connection(model_name)
+        connection_name = connection.name
+
+        if connection.transaction_open is False:
+            self.begin(connection_name)
+
+        logger.debug('Using {} connection "{}".'
+                     .format(self.type(), connection_name))
+
+        with self.exception_handler(sql, model_name, connection_name):
+            logger.debug('On %s: %s', connection_name, sql)
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, _CopyRows(agate_table.rows))
+
+            logger.debug("SQL status: %s in %0.2f seconds",
+                         self.get_status(cursor), (time.time() - pre))
+
+        return sql
+
     @classmethod
     def convert_text_type(cls, agate_table, col_idx):
         return "text"
@@ -1,4 +1,6 @@
 import multiprocessing
+import threading
+import time
 
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
@@ -12,6 +14,12 @@ class RedshiftAdapter(PostgresAdapter):
 
     DEFAULT_TCP_KEEPALIVE = 240
 
+    # temporary cluster credentials are refreshed this many seconds before
+    # they expire, so that connections never open with expired credentials
+    IAM_CREDENTIALS_EXPIRY_MARGIN = 60
+    _cluster_credentials = {}
+    _cluster_credentials_lock = threading.Lock()
+
     @classmethod
     def type(cls):
         return 'redshift'
@@ -40,6 +48,35 @@ class RedshiftAdapter(PostgresAdapter):
                     "Unable to get temporary Redshift cluster credentials: "
                     "{}".format(e))
 
+    @classmethod
+    def get_cached_cluster_credentials(cls, db_user, db_name, cluster_id,
+                                       duration_s):
+        """Return temporary login credentials for the cluster, fetching them
+        from AWS only if there are none yet or they are about to expire. The
+        credentials are shared by every connection in this process."""
+        key = (cluster_id, db_user, db_name, duration_s)
+        margin = min(cls.IAM_CREDENTIALS_EXPIRY_MARGIN, duration_s / 2.0)
+
+        with cls._cluster_credentials_lock:
+            cached = cls._cluster_credentials.get(key)
+            if cached is not None:
+                cluster_creds, expires_at = cached
+                if time.time() < expires_at:
+                    return cluster_creds
+
+            logger.debug("Fetching temporary Redshift cluster credentials")
+            fetched_at = time.time()
+            cluster_creds = cls.fetch_cluster_credentials(
+                db_user, db_name, cluster_id, duration_s)
+            expires_at = fetched_at + duration_s - margin
+            cls._cluster_credentials[key] = (cluster_creds, expires_at)
+            return cluster_creds
+
+    @classmethod
+    def clear_cluster_credentials(cls):
+        with cls._cluster_credentials_lock:
+            cls._cluster_credentials.clear()
+
     @classmethod
     def get_tmp_iam_cluster_credentials(cls, credentials):
         cluster_id = credentials.get('cluster_id')
@@ -53,7 +90,7 @@ class RedshiftAdapter(PostgresAdapter):
                     "'cluster_id' must be provided in profile if IAM "
                     "authentication method selected")
 
-        cluster_creds = cls.fetch_cluster_credentials(
+        cluster_creds = cls.get_cached_cluster_credentials(
             credentials.user,
             credentials.dbname,
             credentials.cluster_id,
@@ -156,6 +193,80 @@ class RedshiftAdapter(PostgresAdapter):
                    table_schema_filter=table_schema_filter).strip()
         return sql
 
+    @classmethod
+    def _get_columns_in_tables_sql(cls, schema_name, table_names):
+        if schema_name is None:
+            table_schema_filter = '1=1'
+        else:
+            table_schema_filter = "table_schema = '{schema_name}'".format(
+                schema_name=schema_name)
+
+        table_list = ', '.join("'{}'".format(t) for t in table_names)
+
+        sql = """
+            with bound_views as (
+                select
+                    ordinal_position,
+                    table_schema,
+                    table_name,
+                    column_name,
+                    data_type,
+                    character_maximum_length,
+                    numeric_precision || ',' || numeric_scale as numeric_size
+
+                from information_schema.columns
+                where table_name in ({table_list})
+            ),
+
+            unbound_views as (
+                select
+                    ordinal_position,
+                    view_schema,
+                    view_name,
+                    col_name,
+                    case
+                        when col_type ilike 'character varying%' then
+                            'character varying'
+                        when col_type ilike 'numeric%' then 'numeric'
+                        else col_type
+                    end as col_type,
+                    case
+                        when col_type like 'character%'
+                        then nullif(REGEXP_SUBSTR(col_type, '[0-9]+'), '')::int
+                        else null
+                    end as character_maximum_length,
+                    case
+                        when col_type like 'numeric%'
+                        then nullif(REGEXP_SUBSTR(col_type, '[0-9,]+'), '')
+                        else null
+                    end as numeric_size
+
+                from pg_get_late_binding_view_cols()
+                cols(view_schema name, view_name name, col_name name,
+                     col_type varchar, ordinal_position int)
+                where view_name in ({table_list})
+            ),
+
+            unioned as (
+                select * from bound_views
+                union all
+                select * from unbound_views
+            )
+
+            select
+                table_name,
+                column_name,
+                data_type,
+                character_maximum_length,
+                numeric_size
+
+            from unioned
+            where {table_schema_filter}
+            order by table_name, ordinal_position
+        """.format(table_list=table_list,
+                   table_schema_filter=table_schema_filter).strip()
+        return sql
+
     def drop_relation(self, relation, model_name=None):
         """
         In Redshift, DROP TABLE ... CASCADE should not be used
@@ -1,6 +1,10 @@
 from __future__ import absolute_import
 
+import gzip
+import os
 import re
+import shutil
+import tempfile
 from io import StringIO
 
 import snowflake.connector
@@ -12,11 +16,16 @@ import dbt.compat
 import dbt.exceptions
 
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.adapters.postgres.impl import _CopyRows
 from dbt.adapters.snowflake.relation import SnowflakeRelation
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import filter_null_values
 
 
+# lines that contain a comment are ignored when checking for empty queries
+COMMENT_LINE_RE = re.compile('^.*(--.*)$', re.MULTILINE)
+
+
 class SnowflakeAdapter(PostgresAdapter):
     Relation = SnowflakeRelation
 
@@ -51,6 +60,11 @@ class SnowflakeAdapter(PostgresAdapter):
             self.release_connection(connection_name)
             raise dbt.exceptions.RuntimeException(e.msg)
 
+    # the most recently split sql strings, and the longest sql to keep there
+    SPLIT_CACHE_SIZE = 256
+    SPLIT_CACHE_MAX_SQL_LENGTH = 10000
+    _split_cache = {}
+
     @classmethod
     def type(cls):
         return 'snowflake'
@@ -107,12 +121,20 @@ class SnowflakeAdapter(PostgresAdapter):
         pass
 
     def _list_relations(self, schema, model_name=None):
+        return self._list_relations_in_schemas([schema], model_name)
+
+    def _list_relations_in_schemas(self, schemas, model_name=None):
+        schemas = list(schemas)
+        if not schemas:
+            return []
+
+        schema_list = ', '.join("'{}'".format(s.lower()) for s in schemas)
         sql = """
         select
           table_name as name, table_schema as schema, table_type as type
         from information_schema.tables
-        where table_schema ilike '{schema}'
-        """.format(schema=schema).strip()  # noqa
+        where lower(table_schema) in ({schemas})
+        """.format(schemas=schema_list).strip()  # noqa
 
         _, cursor = self.add_query(sql, model_name, auto_begin=False)
 
@@ -137,10 +159,18 @@ class SnowflakeAdapter(PostgresAdapter):
     def rename_relation(self, from_relation, to_relation,
                         model_name=None):
         self.cache.rename(from_relation, to_relation)
+        self._invalidate_renamed_columns(from_relation, to_relation)
         sql = 'alter table {} rename to {}'.format(
             from_relation, to_relation)
 
-        connection, cursor = self.add_query(sql, model_name)
+        self.add_ddl_query(sql, model_name)
+
+    @classmethod
+    def batch_ddl_sql(cls, queries):
+        # an anonymous block is sent as one statement, where separate
+        # statements would be split apart and run one at a time
+        body = ''.join('  {};\n'.format(query) for query in queries)
+        return 'execute immediate $$\nbegin\n{}end;\n$$'.format(body)
 
     def add_begin_query(self, name):
         return self.add_query('BEGIN', name, auto_begin=False)
@@ -169,10 +199,30 @@ class SnowflakeAdapter(PostgresAdapter):
     def _split_queries(cls, sql):
         "Splits sql statements at semicolons into discrete queries"
 
+        # without a semicolon there is only one statement to run
+        if ';' not in sql:
+            return [sql]
+
+        cacheable = len(sql) <= cls.SPLIT_CACHE_MAX_SQL_LENGTH
+        if cacheable and sql in cls._split_cache:
+            return cls._split_cache[sql]
+
         sql_s = dbt.compat.to_string(sql)
         sql_buf = StringIO(sql_s)
         split_query = snowflake.connector.util_text.split_statements(sql_buf)
-        return [part[0] for part in split_query]
+        queries = [part[0] for part in split_query]
+
+        if cacheable:
+            if len(cls._split_cache) >= cls.SPLIT_CACHE_SIZE:
+                cls._split_cache.clear()
+            cls._split_cache[sql] = queries
+        return queries
+
+    @classmethod
+    def _is_empty_query(cls, sql):
+        if '--' in sql:
+            sql = COMMENT_LINE_RE.sub('', sql)
+        return sql.strip() == ''
 
     def add_query(self, sql, model_name=None, auto_begin=True,
                   bindings=None, abridge_sql_log=False):
@@ -184,18 +234,17 @@ class SnowflakeAdapter(PostgresAdapter):
             # The snowflake connector is more strict than, eg., psycopg2 -
             # which allows any iterable thing to be passed as a binding.
             bindings = tuple(bindings)
-
-        queries = self._split_queries(sql)
+            # every statement would get the same bindings, so sql with
+            # bindings can only ever be a single statement
+            queries = [sql]
+        else:
+            queries = self._split_queries(sql)
 
         for individual_query in queries:
             # hack -- after the last ';', remove comments and don't run
             # empty queries. this avoids using exceptions as flow control,
             # and also allows us to return the status of the last cursor
-            without_comments = re.sub(
-                re.compile('^.*(--.*)$', re.MULTILINE),
-                '', individual_query).strip()
-
-            if without_comments == "":
+            if self._is_empty_query(individual_query):
                 continue
 
             connection, cursor = super(SnowflakeAdapter, self).add_query(
@@ -212,6 +261,52 @@ class SnowflakeAdapter(PostgresAdapter):
 
         return connection, cursor
 
+    def copy_from_csv(self, relation, agate_table, model_name=None):
+        """Load the rows of agate_table into relation by writing them to a
+        temporary gzipped csv, PUTting it to the table's stage and running
+        COPY INTO. Values are written as agate cast them, with the same
+        quoting as the Postgres COPY, so nulls are the only unquoted empty
+        fields. Return the COPY INTO statement that was run.
+        """
+        namespace = relation.include(identifier=False).render(False)
+        identifier = relation.quote_if(relation.identifier,
+                                       relation.should_quote('identifier'))
+        stage = '@{}.%{}'.format(namespace, identifier)
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'seed.csv.gz')
+            with gzip.open(path, 'wb') as fh:
+                shutil.copyfileobj(_CopyRows(agate_table.rows), fh)
+
+            path = path.replace('\\', '/').replace("'", "\\'")
+            put_sql = (
+                "put 'file://{path}' {stage} source_compression = gzip "
+                "auto_compress = false overwrite = true"
+            ).format(path=path, stage=stage)
+            self.add_query(put_sql, model_name)
+
+            cols_sql = ', '.join(agate_table.column_names)
+            sql = """
+            copy into {relation} ({cols_sql})
+            from {stage}
+            files = ('seed.csv.gz')
+            file_format = (
+                type = csv
+                compression = gzip
+                field_optionally_enclosed_by = '"'
+                null_if = ()
+                empty_field_as_null = true
+            )
+            purge = true
+            """.format(relation=relation.render(False), cols_sql=cols_sql,
+                       stage=stage).strip()
+            self.add_query(sql, model_name)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+        return sql
+
     @classmethod
     def _catalog_filter_table(cls, table, manifest):
         # On snowflake, users can set QUOTED_IDENTIFIERS_IGNORE_CASE, so force
@@ -272,3 +367,28 @@ class SnowflakeAdapter(PostgresAdapter):
                    schema_filter=schema_filter).strip()
 
         return sql
+
+    @classmethod
+    def _get_columns_in_tables_sql(cls, schema_name, table_names):
+        schema_filter = '1=1'
+        if schema_name is not None:
+            schema_filter = "table_schema ilike '{}'".format(schema_name)
+
+        table_list = ', '.join("'{}'".format(t.lower()) for t in table_names)
+
+        sql = """
+        select
+            table_name,
+            column_name,
+            data_type,
+            character_maximum_length,
+            numeric_precision || ',' || numeric_scale as numeric_size
+
+        from information_schema.columns
+        where lower(table_name) in ({table_list})
+          and {schema_filter}
+        order by table_name, ordinal_position
+        """.format(table_list=table_list,
+                   schema_filter=schema_filter).strip()
+
+        return sql
@@ -1,7 +1,17 @@
 
+import hashlib
+import io
+import itertools
+import json
+import random
+
 import agate
 
-DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
+import dbt.compat
+
+# the types a column may have, in the order they are tried. A column gets
+# the first type that every one of its values can be cast to.
+COLUMN_TYPES = [
     agate.data_types.Number(null_values=('null', '')),
     agate.data_types.TimeDelta(null_values=('null', '')),
     agate.data_types.Date(null_values=('null', '')),
@@ -10,7 +20,9 @@ DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
                              false_values=('false',),
                              null_values=('null', '')),
     agate.data_types.Text(null_values=('null', ''))
-])
+]
+
+DEFAULT_TYPE_TESTER = agate.TypeTester(types=COLUMN_TYPES)
 
 
 def table_from_data(data, column_names):
@@ -42,3 +54,272 @@ def as_matrix(table):
 
 def from_csv(abspath):
     return agate.Table.from_csv(abspath, column_types=DEFAULT_TYPE_TESTER)
+
+
+# The number of rows used to pick each seed column's initial type
+DEFAULT_TYPE_SAMPLE_SIZE = 10000
+
+
+def _open_csv(abspath):
+    # agate's csv reader wants bytes on python 2 and text on python 3
+    if dbt.compat.WHICH_PYTHON == 2:
+        return open(abspath, 'rb')
+    return io.open(abspath, encoding='utf-8', newline='')
+
+
+def _iter_csv(abspath):
+    "Yield the rows of a csv file one at a time, header included"
+
+    with _open_csv(abspath) as fh:
+        for row in agate.csv.reader(fh):
+            yield row
+
+
+def _iter_csv_rows(abspath, num_columns):
+    "Yield the data rows of a csv file, padded out to num_columns values"
+
+    rows = _iter_csv(abspath)
+    next(rows, None)
+    for i, row in enumerate(rows):
+        if len(row) > num_columns:
+            raise ValueError(
+                'Row {} has {} values, but Table only has {} columns.'
+                .format(i, len(row), num_columns))
+        elif len(row) < num_columns:
+            row = list(row) + [None] * (num_columns - len(row))
+        yield row
+
+
+def _precision(value):
+    exponent = value.as_tuple().exponent
+    # special values like NaN have a string exponent
+    if not isinstance(exponent, int):
+        return 0
+    return max(0, -exponent)
+
+
+class _ColumnTypeTracker(object):
+    """Follows the type of one csv column through its values, widening it
+    only when a value does not fit. Also remembers the values that decide
+    the column's database type: the longest string and the most precise
+    number.
+
+    `seen_values` is a function returning the column's values that have
+    already been seen, so that a wider type can be checked against them.
+    """
+    def __init__(self, data_type, seen_values):
+        self.data_type = data_type
+        self.seen_values = seen_values
+        self.has_values = False
+        self.longest = None
+        self.longest_length = -1
+        self.most_precise = None
+
+    def _fits(self, data_type, values):
+        try:
+            for value in values:
+                data_type.cast(value)
+        except agate.CastError:
+            return False
+        return True
+
+    def _widen(self, value):
+        # the current type is the first one that fits every value seen so
+        # far, so only the types after it can fit them and this value too
+        current = [type(t) for t in COLUMN_TYPES].index(type(self.data_type))
+        for data_type in COLUMN_TYPES[current + 1:]:
+            if not self._fits(data_type, [value]):
+                continue
+            if self.has_values:
+                seen = self.seen_values()
+                try:
+                    fits = self._fits(data_type, seen)
+                finally:
+                    seen.close()
+                if not fits:
+                    continue
+            self.data_type = data_type
+            self.most_precise = None
+            return
+
+    def update(self, value):
+        try:
+            cast = self.data_type.cast(value)
+        except agate.CastError:
+            self._widen(value)
+            cast = self.data_type.cast(value)
+
+        if cast is None:
+            return
+
+        self.has_values = True
+        length = len(value.encode('utf-8'))
+        if length > self.longest_length:
+            self.longest = value
+            self.longest_length = length
+
+        if isinstance(self.data_type, agate.Number):
+            if (self.most_precise is None or
+                    _precision(cast) > _precision(self.most_precise)):
+                self.most_precise = cast
+
+    def representative(self):
+        if isinstance(self.data_type, agate.Number):
+            return self.most_precise
+        elif isinstance(self.data_type, agate.Text):
+            return self.longest
+        return None
+
+
+def _hash_file(digest, abspath):
+    "Feed a file's contents into `digest`, one chunk at a time"
+
+    with open(abspath, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest
+
+
+def file_checksum(abspath):
+    "Return the sha256 hex digest of a file's contents"
+
+    return _hash_file(hashlib.sha256(), abspath).hexdigest()
+
+
+class SeedRows(object):
+    """The rows of a seed, read from disk and cast to the seed's column types
+    each time they are iterated over.
+    """
+    def __init__(self, seed_table):
+        self.seed_table = seed_table
+
+    def __len__(self):
+        return self.seed_table.num_rows
+
+    def __iter__(self):
+        table = self.seed_table
+        types = table.column_types
+        for row in _iter_csv_rows(table.original_abspath,
+                                  len(table.column_names)):
+            yield tuple(t.cast(v) for t, v in zip(types, row))
+
+
+class SeedTable(object):
+    """A seed csv file whose column types are known, but whose rows stay on
+    disk until they are needed. It supports the parts of the agate.Table
+    interface that seed materializations use: column names and types, type
+    conversion aggregates, and iterating over and counting the rows.
+    """
+    def __init__(self, original_abspath, column_names, column_types,
+                 num_rows, summary):
+        self.original_abspath = original_abspath
+        self.column_names = column_names
+        self.column_types = column_types
+        self.num_rows = num_rows
+        # a small table holding, per column, the value that decides its
+        # database type, so aggregates over it match the whole file
+        self._summary = summary
+
+    @property
+    def columns(self):
+        return self._summary.columns
+
+    def aggregate(self, aggregations):
+        return self._summary.aggregate(aggregations)
+
+    @property
+    def rows(self):
+        return SeedRows(self)
+
+    def __len__(self):
+        return self.num_rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def content_hash(self, column_override=None):
+        """Return a hash of the seed file's contents and of the columns it is
+        loaded into, so that a seed whose hash hasn't changed since it was
+        last loaded can be skipped.
+        """
+        digest = _hash_file(hashlib.sha256(), self.original_abspath)
+        columns = {
+            'names': list(self.column_names),
+            'types': [type(t).__name__ for t in self.column_types],
+            'override': column_override or {},
+        }
+        digest.update(json.dumps(columns, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def sample(self, count):
+        "Return an agate table of `count` rows picked at random"
+
+        picked = []
+        for i, row in enumerate(self.rows):
+            if i < count:
+                picked.append(row)
+            else:
+                j = random.randint(0, i)
+                if j < count:
+                    picked[j] = row
+        return agate.Table(picked, column_names=self.column_names,
+                           column_types=self.column_types)
+
+
+def _infer_sample_types(abspath, sample_size):
+    rows = _iter_csv(abspath)
+    try:
+        header = next(rows, [])
+        sample = list(itertools.islice(rows, sample_size))
+    finally:
+        rows.close()
+    # agate de-duplicates and fills in column names the same way it does
+    # when reading the whole file
+    table = agate.Table(sample, column_names=header,
+                        column_types=DEFAULT_TYPE_TESTER)
+    return table.column_names, table.column_types
+
+
+def seed_table_from_csv(abspath, sample_size=None):
+    """Infer the column types of a seed file from its first `sample_size`
+    rows, then check the rest of the file one value at a time, widening a
+    column's type only when a value doesn't fit. Only a handful of values per
+    column are kept in memory.
+    """
+    if sample_size is None:
+        sample_size = DEFAULT_TYPE_SAMPLE_SIZE
+
+    column_names, sample_types = _infer_sample_types(abspath, sample_size)
+    num_rows = 0
+
+    def seen_values(index):
+        # re-read the values before the current row. This only happens when
+        # a column's type is widened, at most once per type.
+        def values():
+            rows = _iter_csv_rows(abspath, len(column_names))
+            try:
+                for row in itertools.islice(rows, num_rows - 1):
+                    yield row[index]
+            finally:
+                rows.close()
+        return values
+
+    trackers = [
+        _ColumnTypeTracker(t, seen_values(i))
+        for i, t in enumerate(sample_types)
+    ]
+    for row in _iter_csv_rows(abspath, len(column_names)):
+        num_rows += 1
+        for tracker, value in zip(trackers, row):
+            tracker.update(value)
+
+    column_types = [tracker.data_type for tracker in trackers]
+    summary_rows = []
+    for i, tracker in enumerate(trackers):
+        row = [None] * len(trackers)
+        row[i] = tracker.representative()
+        summary_rows.append(row)
+    summary = agate.Table(summary_rows, column_names=column_names,
+                          column_types=column_types)
+
+    return SeedTable(abspath, column_names, column_types, num_rows, summary)
@@ -1,6 +1,5 @@
 import errno
 import fnmatch
-import json
 import os
 import os.path
 import shutil
@@ -120,7 +119,14 @@ def write_file(path, contents=''):
 
 
 def write_json(path, data):
-    return write_file(path, json.dumps(data, cls=dbt.utils.JSONEncoder))
+    """Write `data` to `path` as JSON. The document is written in chunks as it
+    is encoded, and any dbt.utils.JSONObjectStream values in `data` are
+    consumed as they are written.
+    """
+    make_directory(os.path.dirname(path))
+    dbt.compat.write_file_chunks(path, dbt.utils.iterencode_json(data))
+
+    return True
 
 
 def _windows_rmdir_readonly(func, path, exc):
@@ -54,6 +54,17 @@ def write_file(path, s):
             return f.write(to_string(s))
 
 
+def write_file_chunks(path, chunks):
+    if WHICH_PYTHON == 2:
+        with codecs.open(path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(to_string(chunk))
+    else:
+        with open(path, 'w') as f:
+            for chunk in chunks:
+                f.write(to_string(chunk))
+
+
 def suppress_warnings():
     # in python 2, ResourceWarnings don't exist.
     # in python 3, suppress ResourceWarnings about unclosed sockets, as the
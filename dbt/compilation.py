@@ -24,7 +24,7 @@ from dbt.contracts.graph.compiled import CompiledNode, CompiledGraph
 from dbt.clients.system import write_json
 from dbt.logger import GLOBAL_LOGGER as logger
 
-graph_file_name = 'graph.gpickle'
+graph_file_name = 'graph.snapshot'
 manifest_file_name = 'manifest.json'
 
 
@@ -167,7 +167,7 @@ class Compiler(object):
         """
         filename = manifest_file_name
         manifest_path = os.path.join(self.config.target_path, filename)
-        write_json(manifest_path, manifest.serialize())
+        write_json(manifest_path, manifest.serialize_lazily())
 
     def write_graph_file(self, linker):
         filename = graph_file_name
@@ -3,6 +3,51 @@ from dbt.api.object import APIObject
 from dbt.contracts.common import named_property
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 
+CONNECTION_POOL_CONTRACT = {
+    'type': 'object',
+    'additionalProperties': False,
+    'description': (
+        'Settings for the pool of connections each adapter keeps open'
+    ),
+    'properties': {
+        'max_size': {
+            'type': 'integer',
+            'minimum': 1,
+            'description': (
+                'The maximum number of open connections. Defaults to the '
+                'number of threads plus two'
+            ),
+        },
+        'min_size': {
+            'type': 'integer',
+            'minimum': 0,
+            'description': (
+                'Idle connections are never closed below this count'
+            ),
+        },
+        'idle_timeout': {
+            'type': 'number',
+            'minimum': 0,
+            'description': (
+                'Close connections that have been idle this many seconds'
+            ),
+        },
+        'acquire_timeout': {
+            'type': 'number',
+            'minimum': 0,
+            'description': (
+                'How long to wait for a free connection when the pool is full'
+            ),
+        },
+        'pre_ping': {
+            'type': 'boolean',
+            'description': (
+                'Run a trivial query on idle connections before re-using them'
+            ),
+        },
+    },
+}
+
 POSTGRES_CREDENTIALS_CONTRACT = {
     'type': 'object',
     'additionalProperties': False,
@@ -30,6 +75,7 @@ POSTGRES_CREDENTIALS_CONTRACT = {
         'keepalives_idle': {
             'type': 'integer',
         },
+        'connection_pool': CONNECTION_POOL_CONTRACT,
     },
     'required': ['dbname', 'host', 'user', 'pass', 'port', 'schema'],
 }
@@ -81,6 +127,7 @@ REDSHIFT_CREDENTIALS_CONTRACT = {
         'keepalives_idle': {
             'type': 'integer',
         },
+        'connection_pool': CONNECTION_POOL_CONTRACT,
         'required': ['dbname', 'host', 'user', 'port', 'schema']
     }
 }
@@ -112,7 +159,8 @@ SNOWFLAKE_CREDENTIALS_CONTRACT = {
         },
         'client_session_keep_alive': {
             'type': 'boolean',
-        }
+        },
+        'connection_pool': CONNECTION_POOL_CONTRACT,
     },
     'required': ['account', 'user', 'password', 'database', 'schema'],
 }
@@ -139,6 +187,7 @@ BIGQUERY_CREDENTIALS_CONTRACT = {
         'timeout_seconds': {
             'type': 'integer',
         },
+        'connection_pool': CONNECTION_POOL_CONTRACT,
     },
     'required': ['method', 'project', 'schema'],
 }
@@ -7,6 +7,7 @@ from dbt.exceptions import ValidationException
 from dbt.node_types import NodeType
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt import tracking
+from dbt.utils import JSONObjectStream
 import dbt.utils
 
 # We allow either parsed or compiled nodes, as some 'compile()' calls in the
@@ -164,6 +165,25 @@ def build_edges(nodes):
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
+def _iter_serialized(objects):
+    for unique_id, obj in objects.items():
+        yield unique_id, obj.serialize()
+
+
+def _iter_parent_map(nodes):
+    for unique_id, node in nodes.items():
+        yield unique_id, sorted(node.depends_on_nodes)
+
+
+def _iter_child_map(nodes):
+    forward_edges = {unique_id: [] for unique_id in nodes}
+    for unique_id, node in nodes.items():
+        for parent_id in node.depends_on_nodes:
+            forward_edges[parent_id].append(unique_id)
+    for unique_id, children in forward_edges.items():
+        yield unique_id, sorted(children)
+
+
 class Manifest(APIObject):
     SCHEMA = PARSED_MANIFEST_CONTRACT
     """The manifest for the full graph, after parsing and during compilation.
@@ -224,6 +244,23 @@ class Manifest(APIObject):
             'disabled': self.disabled,
         }
 
+    def serialize_lazily(self):
+        """Like serialize, but the nodes, macros, docs and edge maps are
+        JSONObjectStreams that serialize one entry at a time as they are
+        written by dbt.clients.system.write_json. The result can only be
+        written once.
+        """
+        return {
+            'nodes': JSONObjectStream(_iter_serialized(self.nodes)),
+            'macros': JSONObjectStream(_iter_serialized(self.macros)),
+            'docs': JSONObjectStream(_iter_serialized(self.docs)),
+            'parent_map': JSONObjectStream(_iter_parent_map(self.nodes)),
+            'child_map': JSONObjectStream(_iter_child_map(self.nodes)),
+            'generated_at': self.generated_at,
+            'metadata': self.metadata,
+            'disabled': self.disabled,
+        }
+
     def _find_by_name(self, name, package, subgraph, nodetype):
         """
 
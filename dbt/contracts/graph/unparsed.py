@@ -71,6 +71,12 @@ UNPARSED_NODE_CONTRACT = deep_merge(
                     NodeType.Archive,
                 ]
             },
+            'checksum': {
+                'type': 'string',
+                'description': (
+                    'For seeds, the sha256 of the csv file, so that changes '
+                    'to its contents can be detected.'),
+            },
         },
         'required': UNPARSED_BASE_CONTRACT['required'] + [
             'resource_type', 'name']
@@ -2,14 +2,17 @@ STRICT_MODE = False
 NON_DESTRUCTIVE = False
 FULL_REFRESH = False
 LOG_CACHE_EVENTS = False
+CACHE_EVENT_FORMAT = 'graph'
 USE_CACHE = True
 
 
 def reset():
-    global STRICT_MODE, NON_DESTRUCTIVE, FULL_REFRESH, LOG_CACHE_EVENTS
+    global STRICT_MODE, NON_DESTRUCTIVE, FULL_REFRESH, LOG_CACHE_EVENTS, \
+        CACHE_EVENT_FORMAT
 
     STRICT_MODE = False
     NON_DESTRUCTIVE = False
     FULL_REFRESH = False
     LOG_CACHE_EVENTS = False
+    CACHE_EVENT_FORMAT = 'graph'
     USE_CACHE = True
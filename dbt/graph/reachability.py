@@ -0,0 +1,65 @@
+import networkx as nx
+
+
+class ReachabilityIndex(object):
+    """Ancestor and descendant sets for every node in a DAG, stored as bitsets
+    over a topological numbering of the nodes. Bit i of a bitset refers to the
+    i-th node in topological order. Each direction is computed in a single
+    pass over the graph the first time it is needed, after which expanding
+    any number of nodes is a union of their bitsets.
+    """
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = list(nx.topological_sort(graph))
+        self.positions = {node: i for i, node in enumerate(self.nodes)}
+        self._ancestors = None
+        self._descendants = None
+
+    def _build(self, order, neighbors):
+        reachable = [0] * len(self.nodes)
+        for node in order:
+            bits = 0
+            for neighbor in neighbors(node):
+                j = self.positions[neighbor]
+                bits |= reachable[j] | (1 << j)
+            reachable[self.positions[node]] = bits
+        return reachable
+
+    def _ancestor_bits(self):
+        if self._ancestors is None:
+            # parents always come before their children in topological order
+            self._ancestors = self._build(self.nodes,
+                                          self.graph.predecessors)
+        return self._ancestors
+
+    def _descendant_bits(self):
+        if self._descendants is None:
+            self._descendants = self._build(reversed(self.nodes),
+                                            self.graph.successors)
+        return self._descendants
+
+    def _union(self, bitsets, nodes):
+        bits = 0
+        for node in nodes:
+            bits |= bitsets[self.positions[node]]
+        return bits
+
+    def to_nodes(self, bits):
+        """Convert a bitset into the set of nodes it contains."""
+        # bin() is the cheapest way to find the set bits of a python int.
+        # Reverse it so that the index of each digit is its bit position.
+        digits = bin(bits)[:1:-1]
+        found = set()
+        i = digits.find('1')
+        while i != -1:
+            found.add(self.nodes[i])
+            i = digits.find('1', i + 1)
+        return found
+
+    def get_ancestors(self, nodes):
+        """Return every ancestor of any of the given nodes."""
+        return self.to_nodes(self._union(self._ancestor_bits(), nodes))
+
+    def get_descendants(self, nodes):
+        """Return every descendant of any of the given nodes."""
+        return self.to_nodes(self._union(self._descendant_bits(), nodes))
@@ -1,10 +1,17 @@
-import networkx as nx
+from collections import defaultdict
+import json
+import os
+
 from dbt.logger import GLOBAL_LOGGER as logger
 
 from dbt.utils import is_enabled, get_materialization, coalesce
 from dbt.node_types import NodeType
 from dbt.contracts.graph.parsed import ParsedNode
+from dbt.graph.reachability import ReachabilityIndex
+import dbt.clients.system
+import dbt.compilation
 import dbt.exceptions
+import dbt.utils
 
 SELECTOR_PARENTS = '+'
 SELECTOR_CHILDREN = '+'
@@ -15,6 +22,12 @@ SELECTOR_DELIMITER = ':'
 class SELECTOR_FILTERS(object):
     FQN = 'fqn'
     TAG = 'tag'
+    STATE = 'state'
+
+
+class SELECTOR_STATES(object):
+    NEW = 'new'
+    MODIFIED = 'modified'
 
 
 def split_specs(node_specs):
@@ -120,37 +133,285 @@ def _node_is_match(qualified_name, package_names, fqn):
     return False
 
 
+def node_contents_hash(node, macros):
+    """Hash everything about a node that changes what it builds: its raw SQL,
+    its config, the SQL of the macros it depends on and, for seeds, the
+    checksum of the csv file. `node` is a node
+    dict and `macros` maps macro unique IDs to macro dicts, so the hash can
+    be computed from either a Manifest or a saved manifest.json.
+    """
+    macro_ids = sorted(node.get('depends_on', {}).get('macros', []))
+    contents = {
+        'raw_sql': node.get('raw_sql'),
+        'config': node.get('config'),
+        'macros': [
+            [macro_id, macros.get(macro_id, {}).get('raw_sql')]
+            for macro_id in macro_ids
+        ],
+    }
+    # only present for seeds, so the hashes of other nodes match manifests
+    # written before checksums were recorded
+    if node.get('checksum') is not None:
+        contents['checksum'] = node['checksum']
+    return dbt.utils.md5(json.dumps(contents, sort_keys=True,
+                                    cls=dbt.utils.JSONEncoder))
+
+
+class PreviousState(object):
+    """The manifest.json written by a previous dbt invocation, used by the
+    'state' selector to find nodes that are new or changed since then. `path`
+    is either the manifest.json file or the target directory containing it.
+    The manifest is only read when it is first needed.
+    """
+    def __init__(self, path):
+        if os.path.isdir(path):
+            path = os.path.join(path, dbt.compilation.manifest_file_name)
+        self.path = path
+        self._node_hashes = None
+
+    def _load(self):
+        if not dbt.clients.system.path_exists(self.path):
+            raise dbt.exceptions.RuntimeException(
+                'Could not find a previous manifest at {}'.format(self.path)
+            )
+
+        contents = dbt.clients.system.load_file_contents(self.path)
+        manifest = json.loads(contents)
+        macros = manifest.get('macros', {})
+        return {
+            unique_id: node_contents_hash(node, macros)
+            for unique_id, node in manifest.get('nodes', {}).items()
+        }
+
+    def get_node_hashes(self):
+        if self._node_hashes is None:
+            self._node_hashes = self._load()
+        return self._node_hashes
+
+
+class FQNTrie(object):
+    """A prefix tree over node FQNs. Each level of the tree is keyed by one
+    FQN component, and a node's unique ID is stored at the level where its
+    FQN ends.
+    """
+    def __init__(self):
+        self.children = {}
+        self.node_ids = set()
+
+    def insert(self, fqn, node_id):
+        trie = self
+        for part in fqn:
+            trie = trie.children.setdefault(part, FQNTrie())
+        trie.node_ids.add(node_id)
+
+    def find(self, prefix):
+        """Return the subtree for the given FQN prefix, or None if no FQN
+        starts with that prefix.
+        """
+        trie = self
+        for part in prefix:
+            trie = trie.children.get(part)
+            if trie is None:
+                return None
+        return trie
+
+    def all_node_ids(self):
+        """Return the unique IDs of every FQN in this subtree."""
+        found = set()
+        to_visit = [self]
+        while to_visit:
+            trie = to_visit.pop()
+            found.update(trie.node_ids)
+            to_visit.extend(trie.children.values())
+        return found
+
+
+class SelectionIndex(object):
+    """Indexes over the nodes of a graph that answer node selectors without
+    scanning every node. The FQN trie, tag index, reachability index and
+    child test map are each built the first time they are needed, and can
+    then be shared by any number of specs.
+    """
+    def __init__(self, graph, macros=None, previous_state=None):
+        self.graph = graph
+        self.macros = coalesce(macros, {})
+        self.previous_state = previous_state
+        self._package_names = None
+        self._fqn_trie = None
+        self._fqns = None
+        self._nodes_by_name = None
+        self._nodes_by_tag = None
+        self._reachability = None
+        self._child_tests = None
+
+    def _build_fqn_index(self):
+        self._package_names = get_package_names(self.graph)
+        self._fqn_trie = FQNTrie()
+        self._fqns = {}
+        self._nodes_by_name = defaultdict(set)
+
+        for node in self.graph.nodes():
+            fqn = tuple(self.graph.node[node]['fqn'])
+            self._fqns[node] = fqn
+            self._fqn_trie.insert(fqn, node)
+            self._nodes_by_name[fqn[-1]].add(node)
+
+    def _build_tag_index(self):
+        self._nodes_by_tag = defaultdict(set)
+
+        for node in self.graph.nodes():
+            for tag in self.graph.node[node]['tags']:
+                self._nodes_by_tag[tag].add(node)
+
+    def _get_selected_nodes(self, node_selector):
+        """Return every node for which is_selected_node(fqn, node_selector)
+        is true.
+        """
+        if SELECTOR_GLOB in node_selector:
+            prefix = node_selector[:node_selector.index(SELECTOR_GLOB)]
+            trie = self._fqn_trie.find(prefix)
+            if trie is None:
+                return set()
+            return trie.all_node_ids()
+
+        prefix, name = node_selector[:-1], node_selector[-1]
+        trie = self._fqn_trie.find(prefix)
+        if trie is None:
+            return set()
+
+        # the selector is a prefix of the fqn...
+        selected = set()
+        child = trie.children.get(name)
+        if child is not None:
+            selected.update(child.all_node_ids())
+
+        # ...or everything but the last part of the selector is a prefix of
+        # the fqn, and the last part matches the node name
+        for node in self._nodes_by_name.get(name, ()):
+            if self._fqns[node][:len(prefix)] == prefix:
+                selected.add(node)
+
+        return selected
+
+    def get_nodes_by_qualified_name(self, qualified_name_selector):
+        """Return all nodes in the graph that match the
+        qualified_name_selector. This selects the same nodes as calling
+        _node_is_match on every node in the graph.
+
+        :param str qualified_name_selector: The selector or node name
+        """
+        if self._fqn_trie is None:
+            self._build_fqn_index()
+
+        qualified_name = tuple(qualified_name_selector.split("."))
+        selected = set()
+
+        if len(qualified_name) == 1:
+            selected.update(self._nodes_by_name.get(qualified_name[0], ()))
+
+        if qualified_name[0] in self._package_names:
+            selected.update(self._get_selected_nodes(qualified_name))
+
+        for package_name in self._package_names:
+            local_qualified_node_name = (package_name,) + qualified_name
+            selected.update(
+                self._get_selected_nodes(local_qualified_node_name)
+            )
+
+        return selected
+
+    def get_nodes_by_tag(self, tag_name):
+        """Return all nodes in the graph that have the specified tag."""
+        if self._nodes_by_tag is None:
+            self._build_tag_index()
+
+        return set(self._nodes_by_tag.get(tag_name, ()))
+
+    def get_nodes_by_state(self, state_name):
+        """Return all nodes that are new (state:new), or new or changed
+        (state:modified), compared to the previous state.
+        """
+        if self.previous_state is None:
+            raise dbt.exceptions.RuntimeException(
+                "The 'state' selector requires a previous manifest. Pass "
+                "its location with --state"
+            )
+
+        valid_states = (SELECTOR_STATES.NEW, SELECTOR_STATES.MODIFIED)
+        if state_name not in valid_states:
+            raise dbt.exceptions.RuntimeException(
+                "The state '{}' is invalid. Must be one of [{}]"
+                .format(state_name, ", ".join(valid_states))
+            )
+
+        previous_hashes = self.previous_state.get_node_hashes()
+        selected = set()
+        for node in self.graph.nodes():
+            previous_hash = previous_hashes.get(node)
+            if previous_hash is None:
+                selected.add(node)
+            elif state_name == SELECTOR_STATES.MODIFIED:
+                node_hash = node_contents_hash(self.graph.node[node],
+                                               self.macros)
+                if node_hash != previous_hash:
+                    selected.add(node)
+        return selected
+
+    def _get_reachability(self):
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.graph)
+        return self._reachability
+
+    def get_ancestors(self, nodes):
+        """Return every ancestor of any of the given nodes."""
+        return self._get_reachability().get_ancestors(nodes)
+
+    def get_descendants(self, nodes):
+        """Return every descendant of any of the given nodes."""
+        return self._get_reachability().get_descendants(nodes)
+
+    def get_child_tests(self, nodes):
+        """Return every test that directly depends on any of the given
+        nodes.
+        """
+        if self._child_tests is None:
+            self._child_tests = defaultdict(set)
+            for parent, child in self.graph.edges():
+                resource_type = self.graph.node[child].get('resource_type')
+                if resource_type == NodeType.Test:
+                    self._child_tests[parent].add(child)
+
+        child_tests = set()
+        for node in nodes:
+            child_tests.update(self._child_tests.get(node, ()))
+        return child_tests
+
+
 def get_nodes_by_qualified_name(graph, qualified_name_selector):
-    """Yield all nodes in the graph that match the qualified_name_selector.
+    """Return all nodes in the graph that match the qualified_name_selector.
 
     :param str qualified_name_selector: The selector or node name
     """
-    qualified_name = qualified_name_selector.split(".")
-    package_names = get_package_names(graph)
-
-    for node in graph.nodes():
-        fqn_ish = graph.node[node]['fqn']
-        if _node_is_match(qualified_name, package_names, fqn_ish):
-            yield node
+    index = SelectionIndex(graph)
+    return index.get_nodes_by_qualified_name(qualified_name_selector)
 
 
 def get_nodes_by_tag(graph, tag_name):
-    """ yields nodes from graph that have the specified tag """
+    """Return all nodes in the graph that have the specified tag."""
+    return SelectionIndex(graph).get_nodes_by_tag(tag_name)
 
-    for node in graph.nodes():
-        tags = graph.node[node]['tags']
 
-        if tag_name in tags:
-            yield node
+def get_nodes_from_spec(graph, spec, index=None):
+    if index is None:
+        index = SelectionIndex(graph)
 
-
-def get_nodes_from_spec(graph, spec):
     select_parents = spec['select_parents']
     select_children = spec['select_children']
 
     filter_map = {
-        SELECTOR_FILTERS.FQN: get_nodes_by_qualified_name,
-        SELECTOR_FILTERS.TAG: get_nodes_by_tag,
+        SELECTOR_FILTERS.FQN: index.get_nodes_by_qualified_name,
+        SELECTOR_FILTERS.TAG: index.get_nodes_by_tag,
+        SELECTOR_FILTERS.STATE: index.get_nodes_by_state,
     }
 
     node_filter = spec['filter']
@@ -167,30 +428,21 @@ def get_nodes_from_spec(graph, spec):
         selected_nodes = set()
 
     else:
-        selected_nodes = set(filter_func(graph, node_filter['value']))
+        selected_nodes = filter_func(node_filter['value'])
 
     additional_nodes = set()
-    test_nodes = set()
 
     if select_parents:
-        for node in selected_nodes:
-            parent_nodes = nx.ancestors(graph, node)
-            additional_nodes.update(parent_nodes)
+        additional_nodes.update(index.get_ancestors(selected_nodes))
 
     if select_children:
-        for node in selected_nodes:
-            child_nodes = nx.descendants(graph, node)
-            additional_nodes.update(child_nodes)
+        additional_nodes.update(index.get_descendants(selected_nodes))
 
     model_nodes = selected_nodes | additional_nodes
 
-    for node in model_nodes:
-        # include tests that depend on this node. if we aren't running tests,
-        # they'll be filtered out later.
-        child_tests = [n for n in graph.successors(node)
-                       if graph.node.get(n).get('resource_type') ==
-                       NodeType.Test]
-        test_nodes.update(child_tests)
+    # include tests that depend on these nodes. if we aren't running tests,
+    # they'll be filtered out later.
+    test_nodes = index.get_child_tests(model_nodes)
 
     return model_nodes | test_nodes
 
@@ -205,7 +457,10 @@ def warn_if_useless_spec(spec, nodes):
     )
 
 
-def select_nodes(graph, raw_include_specs, raw_exclude_specs):
+def select_nodes(graph, raw_include_specs, raw_exclude_specs, index=None):
+    if index is None:
+        index = SelectionIndex(graph)
+
     selected_nodes = set()
 
     split_include_specs = split_specs(raw_include_specs)
@@ -215,12 +470,12 @@ def select_nodes(graph, raw_include_specs, raw_exclude_specs):
     exclude_specs = [parse_spec(spec) for spec in split_exclude_specs]
 
     for spec in include_specs:
-        included_nodes = get_nodes_from_spec(graph, spec)
+        included_nodes = get_nodes_from_spec(graph, spec, index)
         warn_if_useless_spec(spec, included_nodes)
         selected_nodes = selected_nodes | included_nodes
 
     for spec in exclude_specs:
-        excluded_nodes = get_nodes_from_spec(graph, spec)
+        excluded_nodes = get_nodes_from_spec(graph, spec, index)
         warn_if_useless_spec(spec, excluded_nodes)
         selected_nodes = selected_nodes - excluded_nodes
 
@@ -231,6 +486,21 @@ class NodeSelector(object):
     def __init__(self, linker, manifest):
         self.linker = linker
         self.manifest = manifest
+        self._valid_graph = None
+        self._valid_index = None
+        self._full_index = None
+
+    def get_valid_graph(self):
+        """Return the subgraph of valid nodes and a SelectionIndex over it.
+        Both are built once and shared by every selection this selector
+        makes.
+        """
+        if self._valid_graph is None:
+            graph = self.linker.graph
+            self._valid_graph = graph.subgraph(self.get_valid_nodes(graph))
+            self._valid_index = SelectionIndex(self._valid_graph,
+                                               macros=self.manifest.macros)
+        return self._valid_graph, self._valid_index
 
     def get_valid_nodes(self, graph):
         valid = []
@@ -241,16 +511,17 @@ class NodeSelector(object):
                 valid.append(node_name)
         return valid
 
-    def get_selected(self, include, exclude, resource_types, tags):
+    def get_selected(self, include, exclude, resource_types, tags,
+                     previous_state=None):
         graph = self.linker.graph
 
         include = coalesce(include, ['*'])
         exclude = coalesce(exclude, [])
         tags = coalesce(tags, [])
 
-        to_run = self.get_valid_nodes(graph)
-        filtered_graph = graph.subgraph(to_run)
-        selected_nodes = select_nodes(filtered_graph, include, exclude)
+        filtered_graph, index = self.get_valid_graph()
+        index.previous_state = previous_state
+        selected_nodes = select_nodes(filtered_graph, include, exclude, index)
 
         filtered_nodes = set()
         for node_name in selected_nodes:
@@ -271,19 +542,15 @@ class NodeSelector(object):
         return is_model and is_ephemeral
 
     def get_ancestor_ephemeral_nodes(self, selected_nodes):
+        if self._full_index is None:
+            self._full_index = SelectionIndex(self.linker.graph)
 
-        node_names = {
-            node: self.manifest.nodes.get(node).name
-            for node in selected_nodes
+        selected_nodes = {
+            node for node in selected_nodes
             if node in self.manifest.nodes
         }
-
-        include_spec = [
-            '+{}'.format(node_names[node])
-            for node in selected_nodes if node in node_names
-        ]
-
-        all_ancestors = select_nodes(self.linker.graph, include_spec, [])
+        all_ancestors = (selected_nodes |
+                         self._full_index.get_ancestors(selected_nodes))
 
         res = []
         for ancestor in all_ancestors:
@@ -299,8 +566,14 @@ class NodeSelector(object):
         exclude = query.get('exclude')
         resource_types = query.get('resource_types')
         tags = query.get('tags')
+        state = query.get('state')
+
+        previous_state = None
+        if state is not None:
+            previous_state = PreviousState(state)
 
-        selected = self.get_selected(include, exclude, resource_types, tags)
+        selected = self.get_selected(include, exclude, resource_types, tags,
+                                     previous_state)
         addins = self.get_ancestor_ephemeral_nodes(selected)
 
         return selected | addins
@@ -0,0 +1,265 @@
+"""A compact, memory-mappable snapshot format for the dependency graph.
+
+A snapshot file is laid out as:
+
+    magic (8 bytes) | directory length (uint32) | directory (JSON) | sections
+
+The directory records the number of nodes, the names of the node attribute
+columns and the (offset, length) of every section. Sections are either blob
+tables (an array of n+1 uint32 offsets followed by the concatenated blobs) or
+adjacency arrays (n+1 uint32 offsets followed by uint32 node indices). Node
+unique IDs live in the 'ids' section, edges in 'succ' and 'pred', and each
+node attribute gets its own 'column:<name>' section holding one JSON-encoded
+value per node (an empty blob means the node does not have that attribute).
+
+Reading a snapshot only maps the file. Unique IDs are decoded the first time
+they are needed and attribute values are decoded one column at a time, when
+they are accessed.
+"""
+import json
+import mmap
+import struct
+from collections import MutableMapping
+
+import dbt.exceptions
+import dbt.utils
+
+
+SNAPSHOT_MAGIC = b'DBTGRAPH'
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct('<8sI')
+_UINT32 = struct.Struct('<I')
+_UINT32_PAIR = struct.Struct('<II')
+_UINT32_SIZE = _UINT32.size
+
+_MISSING = object()
+
+
+def _column_section(column):
+    return 'column:{}'.format(column)
+
+
+def _pack_offsets_and_values(offsets, values):
+    fmt = '<{}I'.format(len(offsets) + len(values))
+    return struct.pack(fmt, *(offsets + values))
+
+
+def _pack_blobs(blobs):
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return _pack_offsets_and_values(offsets, []) + b''.join(blobs)
+
+
+def _pack_adjacency(node_ids, index, neighbors):
+    offsets = [0]
+    targets = []
+    for node_id in node_ids:
+        targets.extend(sorted(index[n] for n in neighbors(node_id)))
+        offsets.append(len(targets))
+    return _pack_offsets_and_values(offsets, targets)
+
+
+def write_snapshot(graph, path, blacklist=()):
+    """Write the networkx DiGraph `graph` to `path` in the snapshot format.
+    Node attributes named in `blacklist` are skipped, so the graph does not
+    have to be copied to strip them out first.
+    """
+    node_ids = sorted(graph.nodes())
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+    columns = set()
+    for node_id in node_ids:
+        columns.update(graph.node[node_id])
+    columns = sorted(columns.difference(blacklist))
+
+    sections = [
+        ('ids', _pack_blobs([n.encode('utf-8') for n in node_ids])),
+        ('succ', _pack_adjacency(node_ids, index, graph.successors)),
+        ('pred', _pack_adjacency(node_ids, index, graph.predecessors)),
+    ]
+
+    encoder = dbt.utils.JSONEncoder()
+    for column in columns:
+        blobs = []
+        for node_id in node_ids:
+            data = graph.node[node_id]
+            if column in data:
+                blobs.append(encoder.encode(data[column]).encode('utf-8'))
+            else:
+                blobs.append(b'')
+        sections.append((_column_section(column), _pack_blobs(blobs)))
+
+    offset = 0
+    layout = {}
+    for name, section in sections:
+        layout[name] = [offset, len(section)]
+        offset += len(section)
+
+    directory = json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'nodes': len(node_ids),
+        'edges': graph.number_of_edges(),
+        'columns': columns,
+        'sections': layout,
+    }).encode('utf-8')
+
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(SNAPSHOT_MAGIC, len(directory)))
+        fh.write(directory)
+        for _, section in sections:
+            fh.write(section)
+
+
+class GraphSnapshot(object):
+    """A read-only view over a snapshot written by write_snapshot. `buf` can
+    be anything that supports the buffer protocol and slicing, usually an
+    mmap of the snapshot file.
+    """
+    def __init__(self, buf):
+        magic, directory_length = _HEADER.unpack_from(buf, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise dbt.exceptions.RuntimeException(
+                'The graph file is not a dbt graph snapshot. Try re-running '
+                '`dbt compile`.'
+            )
+
+        start = _HEADER.size
+        end = start + directory_length
+        directory = json.loads(buf[start:end].decode('utf-8'))
+        if directory['version'] != SNAPSHOT_VERSION:
+            raise dbt.exceptions.RuntimeException(
+                'The graph file has snapshot version {}, but this version of '
+                'dbt reads version {}. Try re-running `dbt compile`.'
+                .format(directory['version'], SNAPSHOT_VERSION)
+            )
+
+        self._buf = buf
+        self._base = end
+        self._sections = directory['sections']
+        self._node_ids = None
+        self._index = None
+        self.num_nodes = directory['nodes']
+        self.num_edges = directory['edges']
+        self.columns = directory['columns']
+        self._column_set = frozenset(self.columns)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'rb') as fh:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buf)
+
+    def close(self):
+        close = getattr(self._buf, 'close', None)
+        if close is not None:
+            close()
+
+    def _section_start(self, name):
+        return self._base + self._sections[name][0]
+
+    def _entry_bounds(self, name, i):
+        start = self._section_start(name)
+        lo, hi = _UINT32_PAIR.unpack_from(self._buf, start + i*_UINT32_SIZE)
+        data_start = start + (self.num_nodes + 1) * _UINT32_SIZE
+        return data_start, lo, hi
+
+    def _blob(self, name, i):
+        data_start, lo, hi = self._entry_bounds(name, i)
+        return self._buf[data_start + lo:data_start + hi]
+
+    def _neighbor_indices(self, name, i):
+        data_start, lo, hi = self._entry_bounds(name, i)
+        fmt = '<{}I'.format(hi - lo)
+        return struct.unpack_from(fmt, self._buf,
+                                  data_start + lo*_UINT32_SIZE)
+
+    def node_ids(self):
+        if self._node_ids is None:
+            self._node_ids = [
+                self._blob('ids', i).decode('utf-8')
+                for i in range(self.num_nodes)
+            ]
+        return self._node_ids
+
+    def index_of(self, node_id):
+        if self._index is None:
+            self._index = {n: i for i, n in enumerate(self.node_ids())}
+        return self._index[node_id]
+
+    def successors(self, node_id):
+        node_ids = self.node_ids()
+        indices = self._neighbor_indices('succ', self.index_of(node_id))
+        return [node_ids[i] for i in indices]
+
+    def predecessors(self, node_id):
+        node_ids = self.node_ids()
+        indices = self._neighbor_indices('pred', self.index_of(node_id))
+        return [node_ids[i] for i in indices]
+
+    def edges(self):
+        node_ids = self.node_ids()
+        for i, node_id in enumerate(node_ids):
+            for j in self._neighbor_indices('succ', i):
+                yield node_id, node_ids[j]
+
+    def get_value(self, index, column, default=None):
+        """Decode the value of `column` for the node at `index`."""
+        if column not in self._column_set:
+            return default
+        blob = self._blob(_column_section(column), index)
+        if not blob:
+            return default
+        return json.loads(blob.decode('utf-8'))
+
+    def node_data(self, node_id):
+        return LazyNodeData(self, self.index_of(node_id))
+
+
+class LazyNodeData(MutableMapping):
+    """The attribute dict of a single snapshot node. Individual keys are
+    decoded on access; iterating or modifying the mapping decodes the whole
+    node.
+    """
+    def __init__(self, snapshot, index):
+        self._snapshot = snapshot
+        self._index = index
+        self._values = {}
+        self._loaded = False
+
+    def _load(self):
+        if not self._loaded:
+            for column in self._snapshot.columns:
+                if column in self._values:
+                    continue
+                value = self._snapshot.get_value(self._index, column, _MISSING)
+                if value is not _MISSING:
+                    self._values[column] = value
+            self._loaded = True
+        return self._values
+
+    def __getitem__(self, key):
+        if self._loaded or key in self._values:
+            return self._values[key]
+
+        value = self._snapshot.get_value(self._index, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+
+    def __delitem__(self, key):
+        del self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def copy(self):
+        return dict(self._load())
@@ -44,6 +44,7 @@
       alter table {{ relation }} add column "{{ column.name }}" {{ column.data_type }};
     {% endcall %}
   {% endfor %}
+  {{ adapter.clear_cached_columns(relation) }}
 {% endmacro %}
 
 {% macro bigquery__create_columns(relation, columns) %}
@@ -1,8 +1,72 @@
+{% macro get_insert_overwrite_merge_sql(target, source, dest_columns, partition_by, partitions) -%}
+    {#-- partitions are rendered as sql literals, eg. DATE "2018-01-01" --#}
+    {%- set dest_cols_csv = dest_columns | map(attribute="name") | join(', ') -%}
+    {%- set literals = partitions | reject('equalto', 'NULL') | list -%}
+
+    merge into {{ target }} as DBT_INTERNAL_DEST
+    using {{ source }} as DBT_INTERNAL_SOURCE
+    on FALSE
+
+    {# columns referenced here belong to the destination, so only the
+       partitions that appear in the new data are scanned and replaced #}
+    when not matched by source
+        and (
+            {%- if literals %}
+            {{ partition_by }} in ({{ literals | join(', ') }})
+            {%- else %}
+            FALSE
+            {%- endif %}
+            {%- if 'NULL' in partitions %}
+            or {{ partition_by }} is null
+            {%- endif %}
+        )
+        then delete
+
+    when not matched then insert
+        ({{ dest_cols_csv }})
+    values
+        ({{ dest_cols_csv }})
+
+{% endmacro %}
+
+
+{% macro bigquery_insert_overwrite(target_relation, source_sql, dest_columns, partition_by) %}
+
+  {#-- build the new data once, so that finding its partitions and merging it
+    -- doesn't run the model's query twice --#}
+  {%- set tmp_relation = adapter.create_temporary_table(source_sql) -%}
+
+  {%- call statement('get_partitions', fetch_result=True) -%}
+    select distinct format('%T', {{ partition_by }}) as partition_literal
+    from {{ tmp_relation }}
+  {%- endcall -%}
+  {%- set partitions = load_result('get_partitions').table.columns['partition_literal'].values() | list -%}
+
+  {% if partitions | length == 0 %}
+    {% call noop_statement('main', 'REPLACED 0 PARTITIONS') -%}
+      -- no new data, nothing to replace
+    {%- endcall %}
+  {% else %}
+    {%- call statement('main') -%}
+      {{ get_insert_overwrite_merge_sql(target_relation, tmp_relation, dest_columns, partition_by, partitions) }}
+    {%- endcall -%}
+  {% endif %}
+
+{% endmacro %}
+
 
 {% materialization incremental, adapter='bigquery' -%}
 
   {%- set unique_key = config.get('unique_key') -%}
   {%- set sql_where = config.get('sql_where') -%}
+  {%- set incremental_strategy = config.get('incremental_strategy', 'merge') -%}
+  {%- set raw_partition_by = config.get('partition_by', none) -%}
+
+  {% if incremental_strategy not in ['merge', 'insert_overwrite'] %}
+    {{ exceptions.raise_compiler_error("Invalid incremental_strategy '" ~ incremental_strategy ~ "', expected one of 'merge', 'insert_overwrite'") }}
+  {% elif incremental_strategy == 'insert_overwrite' and raw_partition_by is none %}
+    {{ exceptions.raise_compiler_error("The 'insert_overwrite' incremental_strategy requires a partition_by config") }}
+  {% endif %}
 
   {%- set non_destructive_mode = (flags.NON_DESTRUCTIVE == True) -%}
   {%- set full_refresh_mode = (flags.FULL_REFRESH == True) -%}
@@ -51,9 +115,13 @@
     {%- endcall -%}
   {%- else -%}
      {% set dest_columns = adapter.get_columns_in_table(schema, identifier) %}
-     {%- call statement('main') -%}
-       {{ get_merge_sql(target_relation, source_sql, unique_key, dest_columns) }}
-     {% endcall %}
+     {% if incremental_strategy == 'insert_overwrite' %}
+       {{ bigquery_insert_overwrite(target_relation, source_sql, dest_columns, raw_partition_by) }}
+     {% else %}
+       {%- call statement('main') -%}
+         {{ get_merge_sql(target_relation, source_sql, unique_key, dest_columns) }}
+       {% endcall %}
+     {% endif %}
   {%- endif %}
 
   {{ run_hooks(post_hooks) }}
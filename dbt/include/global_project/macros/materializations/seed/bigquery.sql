@@ -13,3 +13,12 @@
   {{ adapter.load_dataframe(model['schema'], model['alias'], model['agate_table'], column_override) }}
 
 {% endmacro %}
+
+{% macro bigquery__get_seed_hash(relation) %}
+  {#-- seeds are always reloaded, a load job replaces the whole table --#}
+  {{ return(none) }}
+{% endmacro %}
+
+{% macro bigquery__set_seed_hash(relation, seed_hash) %}
+    -- no-op
+{% endmacro %}
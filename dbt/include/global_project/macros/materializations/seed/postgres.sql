@@ -0,0 +1,6 @@
+{% macro postgres__load_csv_rows(model) %}
+    {% set sql = adapter.copy_from_csv(this, model['agate_table']) %}
+
+    {# Return SQL so we can render it out into the compiled files #}
+    {{ return(sql) }}
+{% endmacro %}
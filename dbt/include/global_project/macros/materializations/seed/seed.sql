@@ -11,6 +11,14 @@
   {{ adapter_macro('load_csv_rows', model) }}
 {%- endmacro %}
 
+{% macro get_seed_hash(relation) -%}
+  {{ return(adapter_macro('get_seed_hash', relation)) }}
+{%- endmacro %}
+
+{% macro set_seed_hash(relation, seed_hash) -%}
+  {{ adapter_macro('set_seed_hash', relation, seed_hash) }}
+{%- endmacro %}
+
 {% macro default__create_csv_table(model) %}
   {%- set agate_table = model['agate_table'] -%}
   {%- set column_override = model['config'].get('column_types', {}) -%}
@@ -84,6 +92,31 @@
 {% endmacro %}
 
 
+{% macro default__get_seed_hash(relation) %}
+  {%- call statement('get_seed_hash', fetch_result=True) -%}
+    select obj_description(c.oid, 'pg_class') as comment
+    from pg_class c
+    join pg_namespace n on n.oid = c.relnamespace
+    where n.nspname = '{{ relation.schema }}'
+      and c.relname = '{{ relation.identifier }}'
+  {%- endcall -%}
+
+  {% set rows = load_result('get_seed_hash').table.rows %}
+  {% set comment = rows[0][0] if rows | length > 0 else none %}
+  {% if comment is string and comment.startswith('dbt seed hash: ') %}
+    {{ return(comment[15:]) }}
+  {% endif %}
+  {{ return(none) }}
+{% endmacro %}
+
+
+{% macro default__set_seed_hash(relation, seed_hash) %}
+  {% call statement('set_seed_hash') -%}
+    comment on table {{ relation.render(False) }} is 'dbt seed hash: {{ seed_hash }}'
+  {%- endcall %}
+{% endmacro %}
+
+
 {% materialization seed, default %}
 
   {%- set identifier = model['alias'] -%}
@@ -95,31 +128,44 @@
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
   {%- set csv_table = model["agate_table"] -%}
+  {%- set seed_hash = csv_table.content_hash(model['config'].get('column_types', {})) -%}
 
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
 
   -- `BEGIN` happens here:
   {{ run_hooks(pre_hooks, inside_transaction=True) }}
 
+  {#-- a seed that was loaded from the same file with the same column types
+    -- doesn't need to be loaded again --#}
+  {%- set unchanged = exists_as_table and not full_refresh_mode
+                      and get_seed_hash(old_relation) == seed_hash -%}
+
   -- build model
   {% set create_table_sql = "" %}
   {% if exists_as_view %}
     {{ exceptions.raise_compiler_error("Cannot seed to '{}', it is a view".format(old_relation)) }}
-  {% elif exists_as_table %}
-    {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation) %}
+  {% elif unchanged %}
+    {% call noop_statement('main', 'UNCHANGED') %}
+      -- dbt seed: {{ this }} is up to date (hash {{ seed_hash }}) --
+    {% endcall %}
   {% else %}
-    {% set create_table_sql = create_csv_table(model) %}
-  {% endif %}
+    {% if exists_as_table %}
+      {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation) %}
+    {% else %}
+      {% set create_table_sql = create_csv_table(model) %}
+    {% endif %}
 
-  {% set status = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set num_rows = (csv_table.rows | length) %}
-  {% set sql = load_csv_rows(model) %}
+    {% set status = 'CREATE' if full_refresh_mode else 'INSERT' %}
+    {% set num_rows = (csv_table.rows | length) %}
+    {% set sql = load_csv_rows(model) %}
+    {{ set_seed_hash(this, seed_hash) }}
 
-  {% call noop_statement('main', status ~ ' ' ~ num_rows) %}
-    {{ create_table_sql }};
-    -- dbt seed --
-    {{ sql }}
-  {% endcall %}
+    {% call noop_statement('main', status ~ ' ' ~ num_rows) %}
+      {{ create_table_sql }};
+      -- dbt seed --
+      {{ sql }}
+    {% endcall %}
+  {% endif %}
 
   {{ run_hooks(post_hooks, inside_transaction=True) }}
 
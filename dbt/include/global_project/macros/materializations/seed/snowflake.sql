@@ -0,0 +1,23 @@
+{% macro snowflake__load_csv_rows(model) %}
+    {% set sql = adapter.copy_from_csv(this, model['agate_table']) %}
+
+    {# Return SQL so we can render it out into the compiled files #}
+    {{ return(sql) }}
+{% endmacro %}
+
+
+{% macro snowflake__get_seed_hash(relation) %}
+  {%- call statement('get_seed_hash', fetch_result=True) -%}
+    select comment
+    from information_schema.tables
+    where table_schema ilike '{{ relation.schema }}'
+      and table_name ilike '{{ relation.identifier }}'
+  {%- endcall -%}
+
+  {% set rows = load_result('get_seed_hash').table.rows %}
+  {% set comment = rows[0][0] if rows | length > 0 else none %}
+  {% if comment is string and comment.startswith('dbt seed hash: ') %}
+    {{ return(comment[15:]) }}
+  {% endif %}
+  {{ return(none) }}
+{% endmacro %}
@@ -22,8 +22,10 @@
 
 
   -- drop the temp relations if they exists for some reason
+  {{ adapter.begin_ddl_batch() }}
   {{ adapter.drop_relation(intermediate_relation) }}
   {{ adapter.drop_relation(backup_relation) }}
+  {{ adapter.flush_ddl_batch() }}
 
   -- setup: if the target relation already exists, truncate or drop it (if it's a view)
   {% if non_destructive_mode -%}
@@ -65,11 +67,14 @@
   {% if non_destructive_mode -%}
     -- noop
   {%- else -%}
+    -- swap the new relation into place with a single round-trip
+    {{ adapter.begin_ddl_batch() }}
     {% if old_relation is not none %}
         {{ adapter.rename_relation(target_relation, backup_relation) }}
     {% endif %}
 
     {{ adapter.rename_relation(intermediate_relation, target_relation) }}
+    {{ adapter.flush_ddl_batch() }}
   {%- endif %}
 
   {{ run_hooks(post_hooks, inside_transaction=True) }}
@@ -35,8 +35,10 @@
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
 
   -- drop the temp relations if they exists for some reason
+  {{ adapter.begin_ddl_batch() }}
   {{ adapter.drop_relation(intermediate_relation) }}
   {{ adapter.drop_relation(backup_relation) }}
+  {{ adapter.flush_ddl_batch() }}
 
   -- `BEGIN` happens here:
   {{ run_hooks(pre_hooks, inside_transaction=True) }}
@@ -61,11 +63,13 @@
 
   -- cleanup
   {% if not should_ignore -%}
-    -- move the existing view out of the way
+    -- move the existing view out of the way, and swap the new one into place
+    {{ adapter.begin_ddl_batch() }}
     {% if old_relation is not none %}
       {{ adapter.rename_relation(target_relation, backup_relation) }}
     {% endif %}
     {{ adapter.rename_relation(intermediate_relation, target_relation) }}
+    {{ adapter.flush_ddl_batch() }}
   {%- endif %}
 
   {{ run_hooks(post_hooks, inside_transaction=True) }}
@@ -2,6 +2,7 @@ import networkx as nx
 from collections import defaultdict
 
 import dbt.utils
+from dbt.graph.snapshot import GraphSnapshot, write_snapshot
 
 
 GRAPH_SERIALIZE_BLACKLIST = [
@@ -105,20 +106,16 @@ class Linker(object):
         self.graph.add_node(node, data)
 
     def write_graph(self, outfile):
-        out_graph = self.remove_blacklisted_attributes_from_nodes(self.graph)
-        nx.write_gpickle(out_graph, outfile)
+        write_snapshot(self.graph, outfile,
+                       blacklist=GRAPH_SERIALIZE_BLACKLIST)
 
     def read_graph(self, infile):
-        self.graph = nx.read_gpickle(infile)
-
-    @classmethod
-    def remove_blacklisted_attributes_from_nodes(cls, graph):
-        graph = graph.copy()
-        for node_name, node in graph.node.items():
-            slim_node = node.copy()
-            for key in GRAPH_SERIALIZE_BLACKLIST:
-                if key in slim_node:
-                    del slim_node[key]
-
-            graph.node[node_name] = slim_node
-        return graph
+        snapshot = GraphSnapshot.from_file(infile)
+        graph = nx.DiGraph()
+        for node_id in snapshot.node_ids():
+            graph.add_node(node_id)
+            # node attributes are only decoded from the snapshot when they
+            # are accessed
+            graph.node[node_id] = snapshot.node_data(node_id)
+        graph.add_edges_from(snapshot.edges())
+        self.graph = graph
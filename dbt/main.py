@@ -252,6 +252,7 @@ def invoke_dbt(parsed):
 
     flags.NON_DESTRUCTIVE = getattr(parsed, 'non_destructive', False)
     flags.LOG_CACHE_EVENTS = getattr(parsed, 'log_cache_events', False)
+    flags.CACHE_EVENT_FORMAT = getattr(parsed, 'cache_event_format', 'graph')
     flags.USE_CACHE = getattr(parsed, 'use_cache', True)
 
     arg_drop_existing = getattr(parsed, 'drop_existing', False)
@@ -346,6 +347,15 @@ def parse_args(args):
         help=argparse.SUPPRESS,
     )
 
+    # with --log-cache-events, 'graph' dumps the whole cache around every
+    # change and 'compact' logs one record per change instead
+    base_subparser.add_argument(
+        '--cache-event-format',
+        choices=['graph', 'compact'],
+        default='graph',
+        help=argparse.SUPPRESS,
+    )
+
     base_subparser.add_argument(
         '--bypass-cache',
         action='store_false',
@@ -455,6 +465,19 @@ def parse_args(args):
             Specify the models to exclude.
             """
         )
+        sub.add_argument(
+            '--state',
+            required=False,
+            type=str,
+            help="""
+            The manifest.json from a previous run, or the directory containing
+            it, used by the state: selector to find new or modified nodes. This
+            must not be the current target directory, as its manifest.json is
+            overwritten when the project is compiled. Seed files are only
+            checksummed when --state is given, so changed seed contents are
+            only detected against a manifest written by a run that used it.
+            """
+        )
         sub.add_argument(
             '--threads',
             type=int,
@@ -499,6 +522,15 @@ def parse_args(args):
         action='store_true',
         help='Show a sample of the loaded data in the terminal'
     )
+    seed_sub.add_argument(
+        '--type-sample-size',
+        type=int,
+        default=None,
+        help="""
+        The number of rows used to infer the type of each seed column.
+        Later rows only widen a column's type if they don't fit it.
+        """
+    )
     seed_sub.set_defaults(cls=seed_task.SeedTask, which='seed')
 
     serve_sub = docs_subs.add_parser('serve', parents=[base_subparser])
@@ -551,6 +583,17 @@ def parse_args(args):
         Specify the models to exclude from testing.
         """
     )
+    sub.add_argument(
+        '--state',
+        required=False,
+        type=str,
+        help="""
+        The manifest.json from a previous run, or the directory containing it,
+        used by the state: selector to find new or modified nodes. Seed files
+        are only checksummed when --state is given, so changed seed contents
+        are only detected against a manifest written by a run that used it.
+        """
+    )
 
     sub.set_defaults(cls=test_task.TestTask, which='test')
 
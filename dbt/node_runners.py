@@ -45,6 +45,7 @@ def track_model_run(index, num_nodes, run_model_result):
 
 class BaseRunner(object):
     print_header = True
+    opens_connections = True
 
     def __init__(self, config, adapter, node, node_index, num_nodes):
         self.config = config
@@ -232,6 +233,7 @@ class BaseRunner(object):
 
 class CompileRunner(BaseRunner):
     print_header = False
+    opens_connections = False
 
     def raise_on_first_error(self):
         return True
@@ -306,6 +308,7 @@ class CompileRunner(BaseRunner):
 
 
 class ModelRunner(CompileRunner):
+    opens_connections = True
 
     def raise_on_first_error(self):
         return False
@@ -463,6 +466,7 @@ class ModelRunner(CompileRunner):
 
 
 class TestRunner(CompileRunner):
+    opens_connections = True
 
     def raise_on_first_error(self):
         return False
@@ -15,13 +15,20 @@ from dbt.parser.base import BaseParser
 
 class SeedParser(BaseParser):
     @classmethod
-    def parse_seed_file(cls, file_match, root_dir, package_name, should_parse):
-        """Parse the given seed file, returning an UnparsedNode and the agate
-        table.
+    def parse_seed_file(cls, file_match, root_dir, package_name, should_parse,
+                        sample_size=None, with_checksum=False):
+        """Parse the given seed file, returning an UnparsedNode and the seed
+        table. The table's column types are inferred from the first
+        `sample_size` rows and checked against the rest, but its rows are
+        only read from disk when the seed is loaded. The checksum of the file
+        is only recorded on the node if `with_checksum` is set.
         """
         abspath = file_match['absolute_path']
         logger.debug("Parsing {}".format(abspath))
         table_name = os.path.basename(abspath)[:-4]
+        extra = {}
+        if with_checksum:
+            extra['checksum'] = dbt.clients.agate_helper.file_checksum(abspath)
         node = UnparsedNode(
             path=file_match['relative_path'],
             name=table_name,
@@ -33,10 +40,12 @@ class SeedParser(BaseParser):
             package_name=package_name,
             original_file_path=os.path.join(file_match.get('searched_path'),
                                             file_match.get('relative_path')),
+            **extra
         )
         if should_parse:
             try:
-                table = dbt.clients.agate_helper.from_csv(abspath)
+                table = dbt.clients.agate_helper.seed_table_from_csv(
+                    abspath, sample_size)
             except ValueError as e:
                 dbt.exceptions.raise_compiler_error(str(e), node)
         else:
@@ -61,11 +70,16 @@ class SeedParser(BaseParser):
 
         # we only want to parse seeds if we're inside 'dbt seed'
         should_parse = root_project.args.which == 'seed'
+        sample_size = getattr(root_project.args, 'type_sample_size', None)
+        # checksums are only compared by the state: selector, so only read
+        # every seed file to compute them when a previous state was given
+        with_checksum = getattr(root_project.args, 'state', None) is not None
 
         result = {}
         for file_match in file_matches:
             node, agate_table = cls.parse_seed_file(file_match, root_dir,
-                                                    package_name, should_parse)
+                                                    package_name, should_parse,
+                                                    sample_size, with_checksum)
             node_path = cls.get_path(NodeType.Seed, package_name, node.name)
             parsed = cls.parse_node(node, node_path, root_project,
                                     all_projects.get(package_name),
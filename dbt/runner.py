@@ -94,6 +94,19 @@ class RunManager(object):
                 runners.append(node_runners[unique_id])
         return runners
 
+    def warm_up_connections(self, adapter, num_connections):
+        """Open connections for the worker threads in parallel, rather than
+        having each thread open its own when it runs its first node.
+        """
+        started = time.time()
+        num_opened = adapter.warm_up_connections(num_connections)
+        elapsed = time.time() - started
+
+        if num_opened > 0:
+            msg = "Opened {} connections in {:0.2f}s"
+            dbt.ui.printer.print_timestamped_line(msg.format(num_opened,
+                                                             elapsed))
+
     def execute_nodes(self, linker, Runner, manifest, node_dependency_list):
         adapter = get_adapter(self.config)
 
@@ -103,11 +116,19 @@ class RunManager(object):
         text = "Concurrency: {} threads (target='{}')"
         concurrency_line = text.format(num_threads, target_name)
         dbt.ui.printer.print_timestamped_line(concurrency_line)
-        dbt.ui.printer.print_timestamped_line("")
 
         schemas = list(Runner.get_model_schemas(manifest))
         node_runners = self.get_runners(Runner, adapter, node_dependency_list)
 
+        if Runner.opens_connections:
+            num_runnable = len([
+                r for r in node_runners.values()
+                if not Runner.is_ephemeral_model(r.node)
+            ])
+            self.warm_up_connections(adapter, min(num_threads, num_runnable))
+
+        dbt.ui.printer.print_timestamped_line("")
+
         pool = ThreadPool(num_threads)
         node_results = []
         for node_list in node_dependency_list:
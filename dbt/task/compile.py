@@ -16,6 +16,7 @@ class CompileTask(RunnableTask):
         query = {
             "include": self.args.models,
             "exclude": self.args.exclude,
+            "state": self.args.state,
             "resource_types": NodeType.executable(),
             "tags": [],
         }
@@ -90,7 +90,7 @@ def format_stats(stats):
 
 
 def unflatten(columns):
-    """Given a list of column dictionaries following this layout:
+    """Given an iterable of column dictionaries following this layout:
 
         [{
             'column_comment': None,
@@ -213,14 +213,16 @@ class GenerateTask(CompileTask):
         adapter = get_adapter(self.config)
 
         dbt.ui.printer.print_timestamped_line("Building catalog")
-        results = adapter.get_catalog(manifest)
+        catalog_table = adapter.get_catalog(manifest)
 
-        results = [
-            dict(zip(results.column_names, row))
-            for row in results
-        ]
+        # unflatten only needs one pass over the rows, so don't build a list
+        # of every row dict up front
+        rows = (
+            dict(zip(catalog_table.column_names, row))
+            for row in catalog_table
+        )
 
-        nested_results = unflatten(results)
+        nested_results = unflatten(rows)
         results = {
             'nodes': incorporate_catalog_unique_ids(nested_results, manifest),
             'generated_at': dbt.utils.timestring(),
@@ -17,6 +17,7 @@ class RunTask(RunnableTask):
         query = {
             "include": self.args.models,
             "exclude": self.args.exclude,
+            "state": self.args.state,
             "resource_types": [NodeType.Model],
             "tags": []
         }
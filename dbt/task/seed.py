@@ -1,4 +1,3 @@
-import random
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_runners import SeedRunner
 from dbt.node_types import NodeType
@@ -25,7 +24,7 @@ class SeedTask(RunnableTask):
 
     def show_table(self, result):
         table = result.node['agate_table']
-        rand_table = table.order_by(lambda x: random.random())
+        rand_table = table.sample(10)
 
         schema = result.node['schema']
         alias = result.node['alias']
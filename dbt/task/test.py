@@ -26,6 +26,7 @@ class TestTask(RunnableTask):
         query = {
             "include": self.args.models,
             "exclude": self.args.exclude,
+            "state": self.args.state,
             "resource_types": NodeType.Test
         }
 
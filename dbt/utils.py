@@ -14,7 +14,7 @@ import dbt.exceptions
 import dbt.flags
 
 from dbt.include import GLOBAL_DBT_MODULES_PATH
-from dbt.compat import basestring
+from dbt.compat import basestring, to_string
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_types import NodeType
 from dbt.clients import yaml_helper
@@ -474,3 +474,42 @@ class JSONEncoder(json.JSONEncoder):
         if isinstance(obj, Decimal):
             return float(obj)
         return super(JSONEncoder, self).default(obj)
+
+
+class JSONObjectStream(object):
+    """A JSON object whose entries are produced lazily. `items` is an iterable
+    of (key, value) pairs. It is consumed once, when the object is encoded by
+    iterencode_json.
+    """
+    def __init__(self, items):
+        self.items = items
+
+
+def iterencode_json(data, encoder=None):
+    """Yield the JSON encoding of `data` in chunks. dicts are encoded one
+    entry at a time and JSONObjectStreams are consumed as they are encoded, so
+    neither has to be built or encoded all at once. Every other value is
+    encoded by `encoder`, which defaults to a dbt JSONEncoder.
+    """
+    if encoder is None:
+        encoder = JSONEncoder()
+
+    if isinstance(data, JSONObjectStream):
+        items = data.items
+    elif isinstance(data, dict):
+        items = data.items()
+    else:
+        yield encoder.encode(data)
+        return
+
+    yield '{'
+    first = True
+    for key, value in items:
+        if not first:
+            yield ', '
+        first = False
+        yield encoder.encode(to_string(key))
+        yield ': '
+        for chunk in iterencode_json(value, encoder):
+            yield chunk
+    yield '}'
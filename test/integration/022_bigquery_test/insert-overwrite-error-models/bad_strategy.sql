@@ -0,0 +1,10 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='bogus',
+        partition_by='date_day',
+        sql_where='TRUE'
+    )
+}}
+
+select 1 as id, date '2018-01-01' as date_day
@@ -0,0 +1,9 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='insert_overwrite',
+        sql_where='TRUE'
+    )
+}}
+
+select 1 as id, date '2018-01-01' as date_day
@@ -0,0 +1,29 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='insert_overwrite',
+        partition_by='date_day',
+        sql_where='TRUE'
+    )
+}}
+
+{% if var('second_run', False) %}
+
+-- replaces the 2018-01-02 and null partitions, leaves 2018-01-01 alone
+select 2 as id, date '2018-01-02' as date_day, 'updated' as status
+union all
+select 4 as id, cast(null as date) as date_day, 'updated' as status
+
+{% else %}
+
+select 1 as id, date '2018-01-01' as date_day, 'original' as status
+union all
+select 2 as id, date '2018-01-02' as date_day, 'original' as status
+union all
+select 3 as id, date '2018-01-02' as date_day, 'original' as status
+union all
+select 4 as id, cast(null as date) as date_day, 'original' as status
+union all
+select 5 as id, cast(null as date) as date_day, 'original' as status
+
+{% endif %}
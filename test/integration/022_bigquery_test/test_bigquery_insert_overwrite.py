@@ -0,0 +1,73 @@
+from test.integration.base import DBTIntegrationTest, use_profile
+
+
+class TestBigQueryInsertOverwrite(DBTIntegrationTest):
+
+    @property
+    def schema(self):
+        return "bigquery_test_022"
+
+    @property
+    def models(self):
+        return "test/integration/022_bigquery_test/insert-overwrite-models"
+
+    @property
+    def profile_config(self):
+        return self.bigquery_profile()
+
+    def get_rows(self):
+        return self.run_sql(
+            'select id, status from `{schema}`.partitions order by id',
+            fetch='all'
+        )
+
+    @use_profile('bigquery')
+    def test__bigquery_insert_overwrite(self):
+        results = self.run_dbt(['run'])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(
+            [tuple(row) for row in self.get_rows()],
+            [(1, 'original'), (2, 'original'), (3, 'original'),
+             (4, 'original'), (5, 'original')]
+        )
+
+        results = self.run_dbt(['run', '--vars', 'second_run: true'])
+        self.assertEqual(len(results), 1)
+        # the 2018-01-02 and null partitions are replaced wholesale, so ids
+        # 3 and 5 are gone. The 2018-01-01 partition is untouched.
+        self.assertEqual(
+            [tuple(row) for row in self.get_rows()],
+            [(1, 'original'), (2, 'updated'), (4, 'updated')]
+        )
+
+
+class TestBigQueryInsertOverwriteErrors(DBTIntegrationTest):
+
+    @property
+    def schema(self):
+        return "bigquery_test_022"
+
+    @property
+    def models(self):
+        return "test/integration/022_bigquery_test/insert-overwrite-error-models"
+
+    @property
+    def profile_config(self):
+        return self.bigquery_profile()
+
+    @use_profile('bigquery')
+    def test__bigquery_invalid_incremental_strategy(self):
+        results = self.run_dbt(['run', '--models', 'bad_strategy'],
+                               expect_pass=False)
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].errored)
+        self.assertIn("Invalid incremental_strategy 'bogus'",
+                      results[0].error)
+
+    @use_profile('bigquery')
+    def test__bigquery_insert_overwrite_requires_partition_by(self):
+        results = self.run_dbt(['run', '--models', 'missing_partition_by'],
+                               expect_pass=False)
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].errored)
+        self.assertIn("requires a partition_by config", results[0].error)
@@ -34,6 +34,7 @@ class FakeArgs(object):
         self.full_refresh = False
         self.models = None
         self.exclude = None
+        self.state = None
 
 
 class TestArgs(object):
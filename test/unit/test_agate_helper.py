@@ -2,11 +2,15 @@ from __future__ import unicode_literals
 import unittest
 
 from datetime import datetime
+from datetime import date
 from decimal import Decimal
+import hashlib
 from isodate import tzinfo
 import os
 from shutil import rmtree
 from tempfile import mkdtemp
+
+import agate
 from dbt.clients import agate_helper
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
@@ -53,3 +57,85 @@ class TestAgateHelper(unittest.TestCase):
         self.assertEqual(len(tbl), len(EXPECTED))
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_seed_table_from_csv(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        tbl = agate_helper.seed_table_from_csv(path)
+        self.assertEqual(len(tbl.rows), len(EXPECTED))
+        self.assertEqual(tbl.original_abspath, path)
+        for idx, row in enumerate(tbl.rows):
+            self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_seed_table_widens_types(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write('\n'.join([
+                'a,b,c,d',
+                '1,1,,x',
+                '2,2.25,,longer',
+                'three,3,2018-08-06,xyz',
+            ]).encode('utf-8'))
+        # only the first row is used to pick the initial types
+        tbl = agate_helper.seed_table_from_csv(path, sample_size=1)
+
+        types = [type(t) for t in tbl.column_types]
+        self.assertEqual(types, [agate.Text, agate.Number, agate.Date,
+                                 agate.Text])
+        self.assertEqual(tbl.aggregate(agate.MaxPrecision('b')), 2)
+        self.assertEqual(list(tbl.columns['d'].values_without_nulls()),
+                         ['longer'])
+        self.assertEqual(
+            list(tbl.rows)[2],
+            ('three', Decimal('3'), date(2018, 8, 6), 'xyz')
+        )
+        self.assertEqual(len(tbl.sample(2).rows), 2)
+
+    def test_seed_table_widens_like_full_inference(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write('\n'.join([
+                'a,b,c',
+                '2018-08-06,1,true',
+                '2018-08-07 11:33:29,2,false',
+                ',1 day,3',
+            ]).encode('utf-8'))
+        tbl = agate_helper.seed_table_from_csv(path, sample_size=1)
+        full = agate_helper.from_csv(path)
+
+        # a column is widened to the first type that fits every value, not
+        # straight to text
+        types = [type(t) for t in tbl.column_types]
+        self.assertEqual(types, [agate.DateTime, agate.Text, agate.Text])
+        self.assertEqual(types, [type(t) for t in full.column_types])
+
+    def test_seed_table_content_hash(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        first = agate_helper.seed_table_from_csv(path).content_hash()
+        self.assertEqual(
+            agate_helper.seed_table_from_csv(path).content_hash({}),
+            first
+        )
+        self.assertNotEqual(
+            agate_helper.seed_table_from_csv(path).content_hash({'a': 'text'}),
+            first
+        )
+
+        with open(path, 'ab') as fp:
+            fp.write(b'\n3,y,test,1,20180806T11:35:29.320Z,True,NULL')
+        self.assertNotEqual(
+            agate_helper.seed_table_from_csv(path).content_hash(),
+            first
+        )
+
+    def test_file_checksum(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        self.assertEqual(
+            agate_helper.file_checksum(path),
+            hashlib.sha256(SAMPLE_CSV_DATA.encode('utf-8')).hexdigest()
+        )
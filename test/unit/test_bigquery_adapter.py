@@ -88,6 +88,93 @@ class TestBigQueryAdapter(unittest.TestCase):
 
         mock_open_connection.assert_called_once()
 
+    @patch('dbt.adapters.bigquery.BigQueryAdapter.get_bigquery_client')
+    def test_connections_share_client(self, mock_get_client):
+        mock_get_client.side_effect = lambda credentials: MagicMock()
+        BigQueryAdapter.clear_shared_clients()
+        self.raw_profile['outputs']['oauth']['threads'] = 2
+        adapter = self.get_adapter('oauth')
+
+        first = adapter.get_connection('model_a')
+        second = adapter.get_connection('model_b')
+        self.assertIsNot(first, second)
+        self.assertIs(first.handle, second.handle)
+        mock_get_client.assert_called_once()
+
+        # other credentials get a client of their own
+        self.raw_profile['target'] = 'service_account'
+        other = self.get_adapter('service_account').get_connection('model_c')
+        self.assertIsNot(other.handle, first.handle)
+        self.assertEqual(mock_get_client.call_count, 2)
+        BigQueryAdapter.clear_shared_clients()
+
+    @patch('dbt.adapters.bigquery.BigQueryAdapter.open_connection')
+    def test_list_relations_in_schemas(self, mock_open_connection):
+        def open_connection(connection):
+            connection.state = 'open'
+            connection.handle = MagicMock()
+            return connection
+
+        mock_open_connection.side_effect = open_connection
+        self.raw_profile['outputs']['oauth']['threads'] = 4
+        adapter = self.get_adapter('oauth')
+
+        def list_relations(schema, model_name=None):
+            adapter.get_connection(model_name)
+            return [BigQueryRelation.create(project='dbt-unit-000000',
+                                            schema=schema,
+                                            identifier='table')]
+
+        with patch.object(adapter, '_list_relations',
+                          side_effect=list_relations) as mock_list:
+            relations = adapter._list_relations_in_schemas(['a', 'b', 'c'])
+
+        self.assertEqual(mock_list.call_count, 3)
+        self.assertEqual(sorted(r.schema for r in relations), ['a', 'b', 'c'])
+        # every connection used to list a dataset is returned to the pool
+        self.assertEqual(adapter.connections_in_use, {})
+
+    @patch('dbt.adapters.bigquery.BigQueryAdapter.open_connection')
+    def test_get_catalog(self, mock_open_connection):
+        def open_connection(connection):
+            connection.state = 'open'
+            connection.handle = MagicMock()
+            return connection
+
+        mock_open_connection.side_effect = open_connection
+        adapter = self.get_adapter('oauth')
+
+        def list_relations(schema, model_name=None):
+            return [
+                BigQueryRelation.create(project='dbt-unit-000000',
+                                        schema=schema, identifier=name,
+                                        type='table')
+                for name in ('table_a', 'table_b')
+            ]
+
+        def get_dbt_columns(table):
+            column = MagicMock(data_type='string')
+            column.name = 'id'
+            column.flatten.return_value = [column]
+            return [column]
+
+        manifest = MagicMock()
+        manifest.nodes.values.return_value = [
+            MagicMock(**{'to_dict.return_value': {'schema': 'a'}}),
+        ]
+        with patch.object(adapter, 'list_relations',
+                          side_effect=list_relations), \
+                patch.object(adapter, 'get_dbt_columns_from_bq_table',
+                             side_effect=get_dbt_columns):
+            catalog = adapter.get_catalog(manifest)
+
+        client = adapter.get_connection('catalog').handle
+        self.assertEqual(client.get_table.call_count, 2)
+        self.assertEqual(
+            sorted((row['table_name'], row['column_name']) for row in catalog),
+            [('table_a', 'id'), ('table_b', 'id')]
+        )
+
 
 class TestBigQueryRelation(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,94 @@
+from unittest import TestCase
+import threading
+
+import mock
+
+from dbt.adapters.bigquery.poller import JobPoller
+
+
+class FakeJob(object):
+    def __init__(self, job_id, checks_until_done):
+        self.job_id = job_id
+        self.created = None
+        self.state = 'RUNNING'
+        self.checks_until_done = checks_until_done
+        self.reloads = 0
+
+    def tick(self):
+        self.checks_until_done -= 1
+        if self.checks_until_done <= 0:
+            self.state = 'DONE'
+
+    def reload(self, client=None):
+        self.reloads += 1
+        self.tick()
+
+
+class TestJobPoller(TestCase):
+    def make_poller(self):
+        return JobPoller(min_interval=0.001, max_interval=0.01)
+
+    def test_done_job_returns_immediately(self):
+        job = FakeJob('a', 0)
+        job.state = 'DONE'
+        self.assertTrue(self.make_poller().wait(job, mock.Mock()))
+        self.assertEqual(job.reloads, 0)
+
+    def test_waits_for_job(self):
+        job = FakeJob('a', 3)
+        self.assertTrue(self.make_poller().wait(job, mock.Mock(), timeout=5))
+        self.assertEqual(job.state, 'DONE')
+        self.assertEqual(job.reloads, 3)
+
+    def test_timeout(self):
+        job = FakeJob('a', 10 ** 6)
+        self.assertFalse(self.make_poller().wait(job, mock.Mock(),
+                                                 timeout=0.05))
+
+    def test_reload_errors_are_raised(self):
+        job = FakeJob('a', 3)
+        job.reload = mock.Mock(side_effect=RuntimeError('boom'))
+        with self.assertRaises(RuntimeError):
+            self.make_poller().wait(job, mock.Mock(), timeout=5)
+
+    def test_batched_checks(self):
+        jobs = [FakeJob(str(i), 1) for i in range(5)]
+        client = mock.Mock()
+        client.list_jobs.return_value = jobs
+
+        # the first check happens well after every thread has registered its
+        # job, so all of them are due at the same time
+        poller = JobPoller(min_interval=0.2, max_interval=0.2)
+        results = []
+
+        def wait(job):
+            results.append(poller.wait(job, client, timeout=5))
+
+        threads = [threading.Thread(target=wait, args=(job,)) for job in jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [True] * 5)
+        client.list_jobs.assert_called_once_with(state_filter='done')
+        # each job is only fetched once listing shows it is finished
+        self.assertEqual([job.reloads for job in jobs], [1] * 5)
+
+    def test_list_failure_falls_back(self):
+        jobs = [FakeJob(str(i), 2) for i in range(2)]
+        client = mock.Mock()
+        client.list_jobs.side_effect = RuntimeError('access denied')
+        poller = JobPoller(min_interval=0.05, max_interval=0.05)
+
+        threads = [
+            threading.Thread(target=poller.wait, args=(job, client, 5))
+            for job in jobs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(job.state == 'DONE' for job in jobs))
+        self.assertFalse(poller._can_list)
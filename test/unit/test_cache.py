@@ -1,9 +1,12 @@
 from unittest import TestCase
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import RelationsCache, ColumnCache
 from dbt.adapters.default.relation import DefaultRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
+import dbt.flags
 
+import json
+import mock
 import random
 import time
 
@@ -67,6 +70,30 @@ class TestCache(TestCase):
         self.assertEqual(len(relations), 1)
         self.assertIs(relations[0], relation)
 
+    def test_get_relations_by_identifier(self):
+        bar = make_relation('foo', 'bar')
+        quoted_bar = make_relation('foo', 'BAR')
+        self.cache.add(bar)
+        self.cache.add(quoted_bar)
+        self.cache.add(make_relation('foo', 'baz'))
+
+        relations = self.cache.get_relations('FOO', 'Bar')
+        self.assertEqual(len(relations), 2)
+        self.assertEqual({r.identifier for r in relations}, {'bar', 'BAR'})
+        self.assertEqual(self.cache.get_relations('foo', 'quux'), [])
+
+        self.cache.rename(bar, make_relation('foo', 'quux'))
+        relations = self.cache.get_relations('foo', 'bar')
+        self.assertEqual(len(relations), 1)
+        self.assertIs(relations[0], quoted_bar)
+        relations = self.cache.get_relations('foo', 'quux')
+        self.assertEqual(len(relations), 1)
+        self.assertEqual(relations[0].identifier, 'quux')
+
+        self.cache.drop(quoted_bar)
+        self.assertEqual(self.cache.get_relations('foo', 'bar'), [])
+        self.assertEqual(len(self.cache.get_relations('foo')), 2)
+
     def test_add(self):
         rel = make_relation('foo', 'bar')
         self.cache.add(rel)
@@ -115,6 +142,60 @@ class TestCache(TestCase):
             self.cache.relations[('foo', 'bar')]
 
 
+class TestCacheEventLogging(TestCase):
+    def setUp(self):
+        self.cache = RelationsCache()
+
+    def tearDown(self):
+        dbt.flags.reset()
+
+    def _do_changes(self):
+        self.cache.add(make_relation('foo', 'bar'))
+        self.cache.add(make_relation('foo', 'baz'))
+        self.cache.add_link(make_relation('foo', 'bar'),
+                            make_relation('foo', 'baz'))
+        self.cache.rename(make_relation('foo', 'bar'),
+                          make_relation('foo', 'bar__backup'))
+        self.cache.drop(make_relation('foo', 'bar__backup'))
+
+    def test_no_graph_dump_by_default(self):
+        with mock.patch.object(self.cache, 'dump_graph') as dump_graph:
+            self._do_changes()
+        dump_graph.assert_not_called()
+
+    def test_graph_dump(self):
+        dbt.flags.LOG_CACHE_EVENTS = True
+        with mock.patch.object(self.cache, 'dump_graph') as dump_graph:
+            dump_graph.return_value = {}
+            self._do_changes()
+        # before and after each add and rename
+        self.assertEqual(dump_graph.call_count, 6)
+
+    @mock.patch('dbt.adapters.cache.logger')
+    def test_compact_events(self, logger):
+        dbt.flags.LOG_CACHE_EVENTS = True
+        dbt.flags.CACHE_EVENT_FORMAT = 'compact'
+        with mock.patch.object(self.cache, 'dump_graph') as dump_graph:
+            self._do_changes()
+        dump_graph.assert_not_called()
+
+        events = []
+        for call in logger.debug.call_args_list:
+            try:
+                events.append(json.loads(call[0][0]))
+            except ValueError:
+                continue
+        self.assertEqual(events, [
+            {'event': 'add', 'relation': 'foo.bar'},
+            {'event': 'add', 'relation': 'foo.baz'},
+            {'event': 'link', 'referenced': 'foo.bar',
+             'dependent': 'foo.baz'},
+            {'event': 'rename', 'old': 'foo.bar', 'new': 'foo.bar__backup'},
+            {'event': 'drop', 'relation': 'foo.bar__backup',
+             'cascade': ['foo.bar__backup', 'foo.baz']},
+        ])
+
+
 class TestLikeDbt(TestCase):
     def setUp(self):
         self.cache = RelationsCache()
@@ -325,3 +406,53 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('foo')), 0)
         self.assertEqual(len(self.cache.get_relations('bar')), 1)
         self.assertEqual(len(self.cache.relations), 1)
+
+    def test_references_follow_renames_and_drops(self):
+        self.cache.rename(make_relation('foo', 'table3'),
+                          make_relation('foo', 'table5'))
+        renamed = self.cache.relations[('foo', 'table5')]
+        self.assertEqual(renamed.references, {('foo', 'table1')})
+        dependent = self.cache.relations[('bar', 'table3')]
+        self.assertEqual(dependent.references, {('foo', 'table5')})
+        parent = self.cache.relations[('foo', 'table1')]
+        self.assertIn(('foo', 'table5'), parent.referenced_by)
+        self.assertNotIn(('foo', 'table3'), parent.referenced_by)
+
+        # dropping a leaf releases it from the relation it referenced
+        self.cache.drop(make_relation('bar', 'table3'))
+        self.assertEqual(renamed.referenced_by, {})
+
+
+class TestColumnCache(TestCase):
+    def setUp(self):
+        self.cache = ColumnCache()
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get(None, 'foo', 'bar'))
+        self.cache.set(None, 'foo', 'bar', ['a', 'b'])
+        columns = self.cache.get(None, 'foo', 'bar')
+        self.assertEqual(columns, ['a', 'b'])
+
+        # callers get their own copy
+        columns.append('c')
+        self.assertEqual(self.cache.get(None, 'foo', 'bar'), ['a', 'b'])
+
+    def test_empty_not_cached(self):
+        self.cache.set(None, 'foo', 'bar', [])
+        self.assertIsNone(self.cache.get(None, 'foo', 'bar'))
+
+    def test_invalidate(self):
+        self.cache.set(None, 'foo', 'bar', ['a'])
+        self.cache.set(None, None, 'bar', ['a'])
+        self.cache.set(None, 'baz', 'bar', ['a'])
+        self.cache.set(None, 'foo', 'quux', ['a'])
+
+        self.cache.invalidate('FOO', 'BAR')
+        self.assertIsNone(self.cache.get(None, 'foo', 'bar'))
+        # lookups without a schema could have been for this relation
+        self.assertIsNone(self.cache.get(None, None, 'bar'))
+        self.assertEqual(self.cache.get(None, 'baz', 'bar'), ['a'])
+        self.assertEqual(self.cache.get(None, 'foo', 'quux'), ['a'])
+
+        self.cache.invalidate(None, 'bar')
+        self.assertIsNone(self.cache.get(None, 'baz', 'bar'))
@@ -0,0 +1,163 @@
+from unittest import TestCase
+import threading
+import time
+
+import mock
+
+from dbt.adapters.pool import ConnectionPool
+import dbt.exceptions
+
+
+class FakeConnection(object):
+    def __init__(self, name):
+        self.name = name
+        self.state = 'open'
+
+
+class TestConnectionPool(TestCase):
+    def setUp(self):
+        self.opened = []
+        self.closed = []
+        self.healthy = True
+
+    def _open(self, name):
+        connection = FakeConnection(name)
+        self.opened.append(connection)
+        return connection
+
+    def _close(self, connection):
+        connection.state = 'closed'
+        self.closed.append(connection)
+
+    def _check(self, connection):
+        return self.healthy
+
+    def make_pool(self, **kwargs):
+        kwargs.setdefault('max_size', 2)
+        return ConnectionPool(self._open, self._close, self._check, **kwargs)
+
+    def test_reuse(self):
+        pool = self.make_pool()
+        first = pool.acquire('a')
+        pool.release(first)
+        self.assertIsNone(first.name)
+        self.assertEqual(pool.idle, 1)
+
+        second = pool.acquire('b')
+        self.assertIs(first, second)
+        self.assertEqual(second.name, 'b')
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(pool.allocated, 1)
+
+    def test_closed_connections_are_not_reused(self):
+        pool = self.make_pool()
+        first = pool.acquire('a')
+        first.state = 'closed'
+        pool.release(first)
+        self.assertEqual(pool.idle, 0)
+        self.assertEqual(pool.allocated, 0)
+
+        second = pool.acquire('b')
+        self.assertIsNot(first, second)
+
+    def test_unhealthy_connections_are_replaced(self):
+        pool = self.make_pool()
+        first = pool.acquire('a')
+        pool.release(first)
+
+        self.healthy = False
+        second = pool.acquire('b')
+        self.assertIsNot(first, second)
+        self.assertEqual(self.closed, [first])
+        self.assertEqual(pool.allocated, 1)
+
+    def test_idle_eviction(self):
+        pool = self.make_pool(idle_timeout=10)
+        first = pool.acquire('a')
+        second = pool.acquire('b')
+        now = time.time()
+        with mock.patch('time.time', return_value=now):
+            pool.release(first)
+            pool.release(second)
+
+        with mock.patch('time.time', return_value=now + 11):
+            third = pool.acquire('c')
+
+        self.assertNotIn(third, (first, second))
+        self.assertEqual(set(self.closed), {first, second})
+        self.assertEqual(pool.allocated, 1)
+
+    def test_idle_eviction_keeps_min_size(self):
+        pool = self.make_pool(idle_timeout=10, min_size=1)
+        first = pool.acquire('a')
+        second = pool.acquire('b')
+        now = time.time()
+        with mock.patch('time.time', return_value=now):
+            pool.release(first)
+            pool.release(second)
+
+        with mock.patch('time.time', return_value=now + 11):
+            third = pool.acquire('c')
+
+        # the oldest connection is evicted, the other one is kept and reused
+        self.assertEqual(self.closed, [first])
+        self.assertIs(third, second)
+
+    def test_exhausted_times_out(self):
+        pool = self.make_pool(max_size=1, acquire_timeout=0.01)
+        pool.acquire('a')
+        with self.assertRaises(dbt.exceptions.InternalException):
+            pool.acquire('b')
+
+    def test_waits_for_release(self):
+        pool = self.make_pool(max_size=1, acquire_timeout=10)
+        first = pool.acquire('a')
+
+        timer = threading.Timer(0.05, pool.release, args=(first,))
+        timer.start()
+        second = pool.acquire('b')
+        timer.join()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_failed_open_frees_slot(self):
+        pool = ConnectionPool(mock.Mock(side_effect=RuntimeError),
+                              self._close, self._check, max_size=1)
+        with self.assertRaises(RuntimeError):
+            pool.acquire('a')
+        self.assertEqual(pool.allocated, 0)
+
+    def test_close_idle(self):
+        pool = self.make_pool()
+        first = pool.acquire('a')
+        second = pool.acquire('b')
+        pool.release(first)
+
+        pool.close_idle()
+        self.assertEqual(self.closed, [first])
+        self.assertEqual(pool.allocated, 1)
+        pool.discard(second)
+        self.assertEqual(pool.allocated, 0)
+
+    def test_fill(self):
+        pool = self.make_pool(max_size=3)
+        first = pool.acquire('a')
+
+        # only two more connections fit in the pool
+        self.assertEqual(pool.fill(4), 2)
+        self.assertEqual(pool.idle, 2)
+        self.assertEqual(pool.allocated, 3)
+        self.assertEqual(len(self.opened), 3)
+
+        # nothing left to open
+        pool.release(first)
+        self.assertEqual(pool.fill(3), 0)
+
+    def test_fill_skips_failures(self):
+        open_fn = mock.Mock(side_effect=[RuntimeError, FakeConnection(None)])
+        pool = ConnectionPool(open_fn, self._close, self._check, max_size=2)
+
+        self.assertEqual(pool.fill(2), 1)
+        self.assertEqual(pool.idle, 1)
+        self.assertEqual(pool.allocated, 1)
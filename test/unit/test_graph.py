@@ -13,8 +13,6 @@ import dbt.config
 import dbt.templates
 import dbt.utils
 
-import networkx as nx
-
 from dbt.logger import GLOBAL_LOGGER as logger # noqa
 
 from .utils import config_from_parts_or_dicts
@@ -23,7 +21,7 @@ from .utils import config_from_parts_or_dicts
 class GraphTest(unittest.TestCase):
 
     def tearDown(self):
-        nx.write_gpickle = self.real_write_gpickle
+        dbt.linker.write_snapshot = self.real_write_snapshot
         dbt.utils.dependency_projects = self.real_dependency_projects
         dbt.clients.system.find_matching = self.real_find_matching
         dbt.clients.system.load_file_contents = self.real_load_file_contents
@@ -31,11 +29,11 @@ class GraphTest(unittest.TestCase):
     def setUp(self):
         dbt.flags.STRICT_MODE = True
 
-        def mock_write_gpickle(graph, outfile):
+        def mock_write_snapshot(graph, outfile, blacklist=()):
             self.graph_result = graph
 
-        self.real_write_gpickle = nx.write_gpickle
-        nx.write_gpickle = mock_write_gpickle
+        self.real_write_snapshot = dbt.linker.write_snapshot
+        dbt.linker.write_snapshot = mock_write_snapshot
 
         self.graph_result = None
 
@@ -1,8 +1,13 @@
 import unittest
 
+import json
 import os
+import shutil
 import string
+import tempfile
+import dbt.exceptions
 import dbt.graph.selector as graph_selector
+from dbt.graph.reachability import ReachabilityIndex
 
 import networkx as nx
 
@@ -170,3 +175,161 @@ class GraphSelectionTest(unittest.TestCase):
         test(('X', 'a'), ('X', 'b'), False)
         test(('X', 'a'), ('X', 'a', 'b'), False)
         test(('X', 'a'), ('Y', '*'), False)
+
+    def test__selection_index_matches_node_is_match(self):
+        graph = nx.DiGraph()
+        fqns = [
+            ['X', 'a'],
+            ['X', 'staging', 'a'],
+            ['X', 'staging', 'b'],
+            ['X', 'staging', 'events', 'c'],
+            ['X', 'marts', 'staging'],
+            ['Y', 'a'],
+            ['Y', 'marts', 'd'],
+            ['other', 'e'],
+        ]
+        for fqn in fqns:
+            node = 'model.{}.{}'.format(fqn[0], fqn[-1]) + str(len(fqn))
+            graph.add_node(node, fqn=fqn, tags=[])
+
+        package_names = graph_selector.get_package_names(graph)
+        index = graph_selector.SelectionIndex(graph)
+
+        selectors = [
+            'a', 'b', 'staging', 'X', 'Y', 'other', '*', 'X.*',
+            'X.staging', 'X.staging.*', 'staging.*', 'staging.a',
+            'X.staging.a', 'staging.events', 'marts', 'marts.*', 'Y.a',
+            'X.marts.staging', 'events.c', 'X.events', 'missing',
+            'X.missing.*', 'X.a.b',
+        ]
+        for selector in selectors:
+            expected = {
+                node for node in graph.nodes()
+                if graph_selector._node_is_match(selector.split('.'),
+                                                 package_names,
+                                                 graph.node[node]['fqn'])
+            }
+            self.assertEqual(
+                index.get_nodes_by_qualified_name(selector), expected,
+                'selector {} selected the wrong nodes'.format(selector)
+            )
+
+    def test__select_parents_and_children(self):
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['+Y.d'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.Y.d'])
+        )
+
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['+b+', 'f'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.Y.d', 'm.X.e', 'm.Y.f'])
+        )
+
+    def test__child_tests_selected(self):
+        graph = self.package_graph.copy()
+        graph.add_node('test.X.not_null_a', fqn=['X', 'not_null_a'],
+                       tags=[], resource_type='test')
+        graph.add_edge('m.X.c', 'test.X.not_null_a')
+
+        self.run_specs_and_assert(
+            graph,
+            ['X.c'],
+            [],
+            set(['m.X.c', 'test.X.not_null_a'])
+        )
+
+    def test__reachability_index(self):
+        index = ReachabilityIndex(self.package_graph)
+        for node in self.package_graph.nodes():
+            self.assertEqual(index.get_ancestors([node]),
+                             nx.ancestors(self.package_graph, node))
+            self.assertEqual(index.get_descendants([node]),
+                             nx.descendants(self.package_graph, node))
+
+        self.assertEqual(index.get_ancestors(['m.Y.d', 'm.X.g']),
+                         set(['m.X.a', 'm.Y.b', 'm.X.c']))
+        self.assertEqual(index.get_descendants([]), set())
+
+    def write_previous_manifest(self, nodes):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        with open(os.path.join(tmpdir, 'manifest.json'), 'w') as fp:
+            json.dump({'nodes': nodes, 'macros': {}}, fp)
+        return graph_selector.PreviousState(tmpdir)
+
+    def test__select_by_state(self):
+        graph = self.package_graph.copy()
+        for node in graph.nodes():
+            graph.node[node]['raw_sql'] = 'select 1'
+            graph.node[node]['config'] = {'materialized': 'view'}
+
+        previous_nodes = {
+            node: dict(graph.node[node]) for node in graph.nodes()
+            if node != 'm.X.g'
+        }
+        previous_nodes['m.Y.d']['raw_sql'] = 'select 2'
+        previous_nodes['m.X.e']['config'] = {'materialized': 'table'}
+        state = self.write_previous_manifest(previous_nodes)
+
+        index = graph_selector.SelectionIndex(graph, previous_state=state)
+        self.assertEqual(
+            graph_selector.select_nodes(graph, ['state:modified'], [], index),
+            set(['m.Y.d', 'm.X.e', 'm.X.g'])
+        )
+        self.assertEqual(
+            graph_selector.select_nodes(graph, ['state:new'], [], index),
+            set(['m.X.g'])
+        )
+        self.assertEqual(
+            graph_selector.select_nodes(graph, ['+state:new'], [], index),
+            set(['m.X.a', 'm.X.c', 'm.X.g'])
+        )
+
+    def test__select_by_state_without_state(self):
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            graph_selector.select_nodes(self.package_graph,
+                                        ['state:modified'], [])
+
+    def test__node_contents_hash(self):
+        node = {
+            'raw_sql': 'select 1',
+            'config': {'materialized': 'view', 'tags': []},
+            'depends_on': {'macros': ['macro.root.my_macro'], 'nodes': []},
+        }
+        macros = {'macro.root.my_macro': {'raw_sql': '{% macro a() %}'}}
+        changed_macros = {'macro.root.my_macro': {'raw_sql': '{% macro b() %}'}}
+
+        node_hash = graph_selector.node_contents_hash(node, macros)
+        self.assertEqual(
+            node_hash,
+            graph_selector.node_contents_hash(dict(node), dict(macros))
+        )
+        self.assertNotEqual(
+            node_hash,
+            graph_selector.node_contents_hash(node, changed_macros)
+        )
+
+    def test__node_contents_hash_seed_checksum(self):
+        seed = {
+            'raw_sql': '-- csv --',
+            'config': {'materialized': 'seed'},
+            'depends_on': {'macros': [], 'nodes': []},
+            'checksum': 'a' * 64,
+        }
+        changed_seed = dict(seed, checksum='b' * 64)
+        self.assertNotEqual(
+            graph_selector.node_contents_hash(seed, {}),
+            graph_selector.node_contents_hash(changed_seed, {})
+        )
+
+        # nodes without a checksum hash the same as before they were recorded
+        model = dict(seed)
+        del model['checksum']
+        self.assertEqual(
+            graph_selector.node_contents_hash(model, {}),
+            graph_selector.node_contents_hash(dict(model, checksum=None), {})
+        )
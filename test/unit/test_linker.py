@@ -1,6 +1,11 @@
 import mock
+import os
+import shutil
+import tempfile
 import unittest
 
+import dbt.exceptions
+import dbt.linker
 import dbt.utils
 
 from dbt.compilation import Linker
@@ -97,3 +102,43 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def test__write_and_read_graph__round_trip(self):
+        actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'C')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node('Z')
+        self.linker.update_node_data('A', {
+            'fqn': ['root', 'A'],
+            'tags': ['nightly'],
+            'agate_table': object(),
+        })
+        self.linker.update_node_data('B', {'fqn': ['root', 'B'], 'tags': []})
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'graph.snapshot')
+        self.linker.write_graph(path)
+
+        loaded = dbt.linker.from_file(path)
+        self.assertEqual(set(loaded.nodes()), {'A', 'B', 'C', 'Z'})
+        self.assertEqual(set(loaded.edges()), set(self.linker.edges()))
+        self.assertEqual(loaded.get_node('A')['fqn'], ['root', 'A'])
+        self.assertEqual(loaded.get_node('A').get('tags'), ['nightly'])
+        self.assertNotIn('agate_table', loaded.get_node('A'))
+        self.assertEqual(dict(loaded.get_node('B')),
+                         {'fqn': ['root', 'B'], 'tags': []})
+        self.assertEqual(dict(loaded.get_node('Z')), {})
+        self.assertEqual(loaded.as_dependency_list(),
+                         self.linker.as_dependency_list())
+
+    def test__read_graph__not_a_snapshot(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'graph.snapshot')
+        with open(path, 'wb') as fh:
+            fh.write(b'not a graph at all')
+
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            dbt.linker.from_file(path)
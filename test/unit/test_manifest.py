@@ -2,6 +2,7 @@ import unittest
 import mock
 
 import copy
+import json
 import os
 
 import dbt.flags
@@ -9,7 +10,7 @@ from dbt import tracking
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedNode
 from dbt.contracts.graph.compiled import CompiledNode
-from dbt.utils import timestring
+from dbt.utils import timestring, iterencode_json
 import freezegun
 
 class ManifestTest(unittest.TestCase):
@@ -245,6 +246,14 @@ class ManifestTest(unittest.TestCase):
             []
         )
 
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test__serialize_lazily(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        streamed = ''.join(iterencode_json(manifest.serialize_lazily()))
+        self.assertEqual(json.loads(streamed), manifest.serialize())
+
     def test__to_flat_graph(self):
         nodes = copy.copy(self.nested_nodes)
         manifest = Manifest(nodes=nodes, macros={}, docs={},
@@ -1,9 +1,11 @@
 import mock
+import tempfile
 import unittest
 
 import dbt.flags as flags
 
 import dbt.adapters
+from dbt.clients import agate_helper
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.exceptions import ValidationException
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
@@ -103,6 +105,53 @@ class TestPostgresAdapter(unittest.TestCase):
             port=5432,
             connect_timeout=10)
 
+    @mock.patch('dbt.adapters.postgres.impl.psycopg2')
+    def test_release_and_reuse_connection(self, psycopg2):
+        adapter = self.adapter
+        connection = adapter.get_connection('model_a')
+        adapter.release_connection('model_a')
+        self.assertEqual(adapter.total_connections_allocated(), 1)
+
+        self.assertIs(adapter.get_connection('model_b'), connection)
+        psycopg2.connect.assert_called_once()
+        adapter.cleanup_connections()
+        self.assertEqual(adapter.total_connections_allocated(), 0)
+
+    @mock.patch('dbt.adapters.postgres.impl.psycopg2')
+    def test_pre_ping(self, psycopg2):
+        credentials = self.config.credentials.incorporate(
+            connection_pool={'pre_ping': True, 'max_size': 1}
+        )
+        self.config.credentials = credentials
+        adapter = self.adapter
+        self.assertEqual(adapter.pool.max_size, 1)
+
+        first = adapter.get_connection('model_a')
+        adapter.release_connection('model_a')
+
+        # a healthy connection is re-used
+        self.assertIs(adapter.get_connection('model_b'), first)
+        first.handle.cursor.return_value.execute.assert_called_once_with(
+            'select 1')
+        # the transaction the ping opened is not left open
+        first.handle.rollback.assert_called_once_with()
+        adapter.release_connection('model_b')
+
+        # a handle in autocommit mode has no transaction to roll back
+        first.handle.autocommit = True
+        first.handle.rollback.reset_mock()
+        self.assertIs(adapter.get_connection('model_b'), first)
+        first.handle.rollback.assert_not_called()
+        adapter.release_connection('model_b')
+
+        # a broken one is closed and replaced
+        first.handle.cursor.return_value.execute.side_effect = \
+            RuntimeError('server closed the connection unexpectedly')
+        second = adapter.get_connection('model_c')
+        self.assertIsNot(second, first)
+        self.assertEqual(first.state, 'closed')
+        adapter.cleanup_connections()
+
     @mock.patch.object(PostgresAdapter, 'run_operation')
     def test_get_catalog_various_schemas(self, mock_run):
         column_names = ['table_schema', 'table_name']
@@ -172,6 +221,162 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self.adapter.cleanup_connections()
         self.patcher.stop()
 
+    def test_list_relations_in_schemas(self):
+        self.cursor.fetchall.return_value = [
+            ('table_a', 'Foo', 'table'),
+            ('view_b', 'bar', 'view'),
+        ]
+        relations = self.adapter._list_relations_in_schemas(['Foo', 'bar'])
+
+        # both schemas are listed with a single query
+        self.mock_execute.assert_called_once()
+        sql = self.mock_execute.call_args[0][0]
+        self.assertIn("lower(schemaname) in ('foo', 'bar')", sql)
+        self.assertEqual(
+            [(r.schema, r.identifier, r.type) for r in relations],
+            [('Foo', 'table_a', 'table'), ('bar', 'view_b', 'view')]
+        )
+
+    def test_get_columns_in_table_cached(self):
+        self.cursor.fetchall.return_value = [
+            ('id', 'integer', None, '32,0'),
+        ]
+        def column_queries():
+            return [
+                c for c in self.mock_execute.call_args_list
+                if 'information_schema.columns' in c[0][0]
+            ]
+
+        columns = self.adapter.get_columns_in_table('test_schema', 'table_a')
+        self.assertEqual([c.name for c in columns], ['id'])
+        self.adapter.get_columns_in_table('test_schema', 'table_a')
+        self.assertEqual(len(column_queries()), 1)
+
+        # changing the relation forgets its columns
+        self.adapter.truncate(schema='test_schema', table='table_a')
+        self.adapter.get_columns_in_table('test_schema', 'table_a')
+        self.assertEqual(len(column_queries()), 2)
+
+    def test_get_columns_in_relations(self):
+        self.cursor.fetchall.return_value = [
+            ('table_a', 'id', 'integer', None, '32,0'),
+            ('table_b', 'name', 'text', None, None),
+            ('table_b', 'id', 'integer', None, '32,0'),
+        ]
+        def column_queries():
+            return [
+                c[0][0] for c in self.mock_execute.call_args_list
+                if 'information_schema.columns' in c[0][0]
+            ]
+
+        relations = [
+            self.adapter.Relation.create(schema='test_schema',
+                                         identifier=identifier)
+            for identifier in ('table_b', 'table_a', 'table_c')
+        ]
+        columns = self.adapter.get_columns_in_relations(relations)
+
+        # all three relations are looked up with a single query
+        self.assertEqual(len(column_queries()), 1)
+        self.assertIn("table_name in ('table_b', 'table_a', 'table_c')",
+                      column_queries()[0])
+        self.assertEqual(
+            [[c.name for c in cols] for cols in columns],
+            [['name', 'id'], ['id'], []]
+        )
+
+        # the results warm the column cache
+        self.adapter.get_columns_in_table('test_schema', 'table_a')
+        self.adapter.get_columns_in_relations(relations[:2])
+        self.assertEqual(len(column_queries()), 1)
+
+    def test_copy_from_csv(self):
+        with tempfile.NamedTemporaryFile(suffix='.csv') as fh:
+            fh.write(b'id,name\n1,alice\n2,"bob ""b"""\n')
+            fh.flush()
+            agate_table = agate_helper.from_csv(fh.name)
+
+        loaded = []
+        self.cursor.copy_expert.side_effect = \
+            lambda sql, f: loaded.append(f.read(7) + f.read())
+
+        relation = self.adapter.Relation.create(schema='test_schema',
+                                                identifier='seed')
+        sql = self.adapter.copy_from_csv(relation, agate_table)
+
+        self.assertEqual(
+            sql,
+            'copy "test_schema"."seed" (id, name) from stdin with csv'
+        )
+        self.cursor.copy_expert.assert_called_once()
+        self.assertEqual(self.cursor.copy_expert.call_args[0][0], sql)
+        self.assertEqual(loaded, [b'"1","alice"\n"2","bob ""b"""\n'])
+        # the rows are never rendered into an insert statement
+        for call in self.mock_execute.call_args_list:
+            self.assertNotIn('insert', call[0][0])
+
+    def test_copy_from_csv_nulls(self):
+        with tempfile.NamedTemporaryFile(suffix='.csv') as fh:
+            fh.write(b'id,name,created\n'
+                     b'1,null,2018-01-01\n'
+                     b'NULL,NULL,\n'
+                     b'3,"",null\n')
+            fh.flush()
+            agate_table = agate_helper.from_csv(fh.name)
+
+        loaded = []
+        self.cursor.copy_expert.side_effect = \
+            lambda sql, f: loaded.append(f.read())
+
+        relation = self.adapter.Relation.create(schema='test_schema',
+                                                identifier='seed')
+        self.adapter.copy_from_csv(relation, agate_table)
+
+        # null tokens are sent as unquoted empty fields, which COPY reads as
+        # null in numeric, date and text columns alike
+        self.assertEqual(loaded, [
+            b'"1",,"2018-01-01"\n'
+            b',,\n'
+            b'"3",,\n'
+        ])
+
+    def test_ddl_batch(self):
+        self.adapter.begin_ddl_batch()
+        self.adapter.drop(schema='test_schema', relation='table_b',
+                          relation_type='table')
+        self.adapter.rename(schema='test_schema', from_name='table_a',
+                            to_name='table_b')
+        self.mock_execute.assert_not_called()
+
+        self.adapter.flush_ddl_batch()
+        self.mock_execute.assert_has_calls([
+            mock.call('BEGIN', None),
+            mock.call(
+                'drop table if exists "test_schema".table_b cascade;\n'
+                'alter table "test_schema".table_a rename to table_b',
+                None),
+        ])
+        self.assertEqual(self.mock_execute.call_count, 2)
+
+        # once flushed, ddl runs immediately again
+        self.adapter.drop(schema='test_schema', relation='table_a',
+                          relation_type='table')
+        self.assertEqual(self.mock_execute.call_count, 3)
+
+    def test_ddl_batch_flushed_on_commit(self):
+        self.adapter.begin('master')
+        self.adapter.begin_ddl_batch()
+        self.adapter.drop(schema='test_schema', relation='table_a',
+                          relation_type='table')
+        self.adapter.commit_if_has_connection('master')
+
+        self.mock_execute.assert_has_calls([
+            mock.call('BEGIN', None),
+            mock.call('drop table if exists "test_schema".table_a cascade',
+                      None),
+            mock.call('COMMIT', None),
+        ])
+
     def test_quoting_on_drop_schema(self):
         self.adapter.drop_schema(schema='test_schema')
 
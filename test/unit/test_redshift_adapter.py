@@ -51,6 +51,7 @@ class TestRedshiftAdapter(unittest.TestCase):
         }
 
         self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        RedshiftAdapter.clear_cluster_credentials()
 
     @property
     def adapter(self):
@@ -79,6 +80,34 @@ class TestRedshiftAdapter(unittest.TestCase):
         expected_creds = self.config.credentials.incorporate(password='tmp_password')
         self.assertEquals(creds, expected_creds)
 
+    @mock.patch('dbt.adapters.redshift.impl.time')
+    def test_iam_credentials_cached(self, mock_time):
+        self.config.credentials = self.config.credentials.incorporate(
+            method='iam',
+            cluster_id='my_redshift',
+            iam_duration_seconds=1200
+        )
+        fetch = mock.Mock(return_value={
+            'DbUser': 'root',
+            'DbPassword': 'tmp_password'
+        })
+        mock_time.time.return_value = 1000
+
+        with mock.patch.object(RedshiftAdapter, 'fetch_cluster_credentials',
+                               new=fetch):
+            first = RedshiftAdapter.get_credentials(self.config.credentials)
+            mock_time.time.return_value = 2000
+            second = RedshiftAdapter.get_credentials(self.config.credentials)
+            self.assertEqual(fetch.call_count, 1)
+            self.assertEqual(first, second)
+
+            # close to expiring, the credentials are fetched again
+            mock_time.time.return_value = 1000 + 1200 - 30
+            RedshiftAdapter.get_credentials(self.config.credentials)
+            self.assertEqual(fetch.call_count, 2)
+
+        fetch.assert_called_with('root', 'redshift', 'my_redshift', 1200)
+
     def test_invalid_auth_method(self):
         # we have to set method this way, otherwise it won't validate
         self.config.credentials._contents['method'] = 'badmethod'
@@ -1,9 +1,13 @@
+import gzip
 import mock
+import os
+import tempfile
 import unittest
 
 import dbt.flags as flags
 
 import dbt.adapters
+from dbt.clients import agate_helper
 from dbt.adapters.snowflake import SnowflakeAdapter
 from dbt.exceptions import ValidationException
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
@@ -95,6 +99,95 @@ class TestSnowflakeAdapter(unittest.TestCase):
             mock.call('alter table "test_schema".table_a rename to table_b', None)
         ])
 
+    @mock.patch('dbt.adapters.snowflake.impl.snowflake.connector.util_text'
+                '.split_statements')
+    def test_single_statements_are_not_split(self, split_statements):
+        self.adapter.add_query('select 1 as id')
+        self.adapter.add_query('insert into t values (%s, %s);',
+                               bindings=[1, 'a'])
+
+        split_statements.assert_not_called()
+        self.mock_execute.assert_has_calls([
+            mock.call('select 1 as id', None),
+            mock.call('insert into t values (%s, %s);', (1, 'a')),
+        ])
+
+    def test_multiple_statements(self):
+        sql = 'select 1;\nselect 2;\n-- trailing comment'
+        self.adapter.add_query(sql)
+        self.adapter.add_query(sql)
+
+        self.mock_execute.assert_has_calls([
+            mock.call('select 1;', None),
+            mock.call('select 2;', None),
+        ] * 2)
+        statements = [c for c in self.mock_execute.call_args_list
+                      if c[0][0] != 'BEGIN']
+        self.assertEqual(len(statements), 4)
+        self.assertIn(sql, SnowflakeAdapter._split_cache)
+
+    def test_ddl_batch(self):
+        self.adapter.begin_ddl_batch()
+        self.adapter.drop(schema='test_schema', relation='table_a',
+                          relation_type='table')
+        self.adapter.rename(schema='test_schema', from_name='table_b',
+                            to_name='table_a')
+        self.adapter.flush_ddl_batch()
+
+        # the statements are sent as a single block
+        self.mock_execute.assert_has_calls([
+            mock.call(
+                'execute immediate $$\n'
+                'begin\n'
+                '  drop table if exists "test_schema".table_a cascade;\n'
+                '  alter table "test_schema".table_b rename to table_a;\n'
+                'end;\n'
+                '$$', None)
+        ])
+
+    def test_copy_from_csv(self):
+        with tempfile.NamedTemporaryFile(suffix='.csv') as fh:
+            fh.write(b'id,name,created\n'
+                     b'1,"bob ""b""",2018-01-01\n'
+                     b'NULL,null,\n')
+            fh.flush()
+            agate_table = agate_helper.from_csv(fh.name)
+
+        tmpdir = tempfile.mkdtemp(suffix="it's")
+        staged = []
+
+        def execute(sql, bindings=None):
+            if sql.startswith('put '):
+                with gzip.open(os.path.join(tmpdir, 'seed.csv.gz')) as f:
+                    staged.append(f.read())
+        self.mock_execute.side_effect = execute
+
+        relation = self.adapter.Relation.create(
+            schema='test_schema', identifier='seed',
+            quote_policy={'schema': True})
+
+        with mock.patch('tempfile.mkdtemp', return_value=tmpdir):
+            sql = self.adapter.copy_from_csv(relation, agate_table)
+
+        put_path = os.path.join(tmpdir, 'seed.csv.gz').replace("'", "\\'")
+        self.mock_execute.assert_has_calls([
+            mock.call("put 'file://{}' @\"test_schema\".%seed "
+                      "source_compression = gzip auto_compress = false "
+                      "overwrite = true".format(put_path), None),
+            mock.call(sql, None),
+        ])
+        self.assertTrue(sql.startswith(
+            'copy into "test_schema".seed (id, name, created)'))
+        self.assertIn("files = ('seed.csv.gz')", sql)
+        self.assertIn('empty_field_as_null = true', sql)
+        # the staged file holds the rows as agate cast them, and nulls are
+        # the only unquoted empty fields
+        self.assertEqual(staged, [
+            b'"1","bob ""b""","2018-01-01"\n'
+            b',,\n'
+        ])
+        self.assertFalse(os.path.exists(tmpdir))
+
     def test_client_session_keep_alive_false_by_default(self):
         self.snowflake.assert_has_calls([
             mock.call(
@@ -1,3 +1,5 @@
+from decimal import Decimal
+import json
 import unittest
 
 import dbt.exceptions
@@ -139,3 +141,54 @@ class TestDeepMap(unittest.TestCase):
         with self.assertRaises(dbt.exceptions.DbtConfigError):
             dbt.utils.deep_map(lambda x, _: x, {'foo': object()})
 
+
+
+class TestIterencodeJSON(unittest.TestCase):
+
+    def encode(self, data):
+        return ''.join(dbt.utils.iterencode_json(data))
+
+    def test__matches_json_dumps(self):
+        cases = [
+            {},
+            [],
+            None,
+            'abc',
+            {'a': 1, 'b': [1, 2, {'c': None}], 'd': {'e': {'f': 'g'}}},
+        ]
+        for case in cases:
+            self.assertEqual(json.loads(self.encode(case)), case)
+            self.assertEqual(
+                self.encode(case),
+                json.dumps(case, cls=dbt.utils.JSONEncoder)
+            )
+
+    def test__decimals(self):
+        actual = json.loads(self.encode({'a': [Decimal('1.5')]}))
+        self.assertEqual(actual, {'a': [1.5]})
+
+    def test__object_stream(self):
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield 'key_{}'.format(i), {'value': i}
+
+        data = {
+            'stream': dbt.utils.JSONObjectStream(items()),
+            'empty': dbt.utils.JSONObjectStream(iter([])),
+        }
+        chunks = dbt.utils.iterencode_json(data)
+        self.assertEqual(consumed, [])
+
+        actual = json.loads(''.join(chunks))
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(actual, {
+            'stream': {
+                'key_0': {'value': 0},
+                'key_1': {'value': 1},
+                'key_2': {'value': 2},
+            },
+            'empty': {},
+        })